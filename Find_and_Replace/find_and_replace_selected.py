@@ -12,44 +12,81 @@ This script:
 3. Allows find/replace operations on the selected property across all selected clips
 """
 from __future__ import annotations
-from typing import Any
+from typing import Any, Callable
+from collections import Counter
+from functools import partial
 import sys
 import os
 import platform
 import traceback
 
 
-def add_resolve_module_path() -> bool:
-    """Add DaVinci Resolve's module path to sys.path."""
+# Number of selected items scanned for metadata keys when the dialog opens;
+# "Scan All" in the dialog collects keys from the whole selection
+METADATA_SAMPLE_SIZE = 50
+
+# Full tracebacks from UI handlers are only printed when FR_DEBUG=1
+_DEBUG = os.environ.get("FR_DEBUG") == "1"
+
+# Resolve getter/setter method names per editable property; any other property
+# is a metadata key
+_PROPERTY_METHODS: dict[str, tuple[str, str]] = {
+    "Name": ("GetName", "SetName"),
+    "Clip Color": ("GetClipColor", "SetClipColor"),
+}
+_METADATA_METHODS = ("GetMetadata", "SetMetadata")
+
+# Result message fragments, in display order
+_STATUS_TEMPLATES = (
+    ('modified', "{} item(s) modified"),
+    ('skipped', "{} skipped (text not found)"),
+    ('error', "{} error(s)"),
+)
+
+
+def _get_module_path() -> str | None:
+    """Get DaVinci Resolve's scripting module path for this platform."""
     os_name = platform.system()
 
     if os_name == "Darwin":  # macOS
-        module_path = "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules/"
+        return "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules/"
     elif os_name == "Windows":
         programdata = os.environ.get('PROGRAMDATA', 'C:/ProgramData')
-        module_path = os.path.join(programdata,
-                                   "Blackmagic Design",
-                                   "DaVinci Resolve",
-                                   "Support",
-                                   "Developer",
-                                   "Scripting",
-                                   "Modules")
+        return os.path.join(programdata,
+                            "Blackmagic Design",
+                            "DaVinci Resolve",
+                            "Support",
+                            "Developer",
+                            "Scripting",
+                            "Modules")
     elif os_name == "Linux":
-        module_path = "/opt/resolve/Developer/Scripting/Modules/"
-    else:
-        return False
+        return "/opt/resolve/Developer/Scripting/Modules/"
+    return None
 
-    if module_path not in sys.path:
-        sys.path.insert(0, module_path)
-    return True
+
+# Resolved once at import time - the platform doesn't change during a session
+_MODULE_PATH = _get_module_path()
+
+
+def add_resolve_module_path() -> bool:
+    """Add DaVinci Resolve's module path to sys.path."""
+    if _MODULE_PATH and _MODULE_PATH not in sys.path:
+        sys.path.insert(0, _MODULE_PATH)
+    return _MODULE_PATH is not None
+
+
+# DaVinciResolveScript module, bound by get_resolve() and reused by the dialog
+_dvr: Any | None = None
 
 
 def get_resolve() -> Any | None:
     """Get the DaVinci Resolve scripting API object."""
+    global _dvr
     add_resolve_module_path()
 
     try:
         import DaVinciResolveScript as dvr_script
+        _dvr = dvr_script
         resolve = dvr_script.scriptapp("Resolve")
         if not resolve:
             print("ERROR: Could not connect to DaVinci Resolve.")
@@ -60,6 +97,16 @@ def get_resolve() -> Any | None:
         return None
 
 
+def _get_dvr() -> Any:
+    """Get the DaVinciResolveScript module, importing it if get_resolve() wasn't used."""
+    global _dvr
+    if _dvr is None:
+        add_resolve_module_path()
+        import DaVinciResolveScript as dvr_script
+        _dvr = dvr_script
+    return _dvr
+
+
 class TimelineMetadataEditor:
     """Handles timeline metadata find and replace operations."""
 
@@ -75,7 +122,41 @@ class TimelineMetadataEditor:
         self.media_pool = None
         self.selected_items: list[Any] = []
         self.metadata_properties: list[str] = []
-        self.editable_properties: list[str] = []
+        self.editable_properties: tuple[str, ...] = ()
+        self._editable_set: set[str] = set()
+        # False while metadata_properties only reflects a sample of the selection
+        self.metadata_complete = False
+        # Selection list the current properties were discovered from. Compared by
+        # identity: GetSelectedClips() returns fresh item objects on every call, so
+        # only the very same list is known to hold the same items
+        self._discovered_items: list[Any] | None = None
+        # Per-item RPC result caches, keyed by id(item)
+        self._metadata_cache: dict[int, dict[str, Any]] = {}
+        # One value cache per _PROPERTY_METHODS property
+        self._value_caches: dict[str, dict[int, str]] = {name: {} for name in _PROPERTY_METHODS}
+        # Timeline name -> Timeline object, built lazily once per find_and_replace run
+        self._timeline_by_name: dict[str, Any] | None = None
+
+    def clear_cache(self) -> None:
+        """Drop cached per-item values (call when the selection changes)."""
+        self._metadata_cache.clear()
+        for cache in self._value_caches.values():
+            cache.clear()
+
+    def _get_metadata_cached(self, item: Any) -> dict[str, Any] | None:
+        """
+        Get an item's metadata dict, calling GetMetadata() only on first access.
+
+        Args:
+            item: Media pool item
+
+        Returns:
+            Metadata dict, or None if the item returned no metadata
+        """
+        key = id(item)
+        if key not in self._metadata_cache:
+            self._metadata_cache[key] = item.GetMetadata()
+        return self._metadata_cache[key]
 
     def initialize(self) -> bool:
         """
@@ -125,54 +206,73 @@ class TimelineMetadataEditor:
             print(f"ERROR: Failed to get selected clips: {e}")
             return False
 
-        # Get metadata properties from ALL selected items (merged)
-        try:
-            all_metadata_keys: set[str] = set()
-            for item in self.selected_items:
-                metadata = item.GetMetadata()
-                if metadata:
-                    all_metadata_keys.update(metadata.keys())
+        # Metadata keys are discovered later (see discover_metadata_keys) so the
+        # dialog doesn't wait on a GetMetadata() call per selected clip
+        return True
 
-            if not all_metadata_keys:
-                print("WARNING: No metadata available from any selected clip")
-                self.metadata_properties = []
-            else:
-                # Sort for consistent display order
-                self.metadata_properties = sorted(all_metadata_keys)
+    def discover_metadata_keys(self, sample_size: int | None = None) -> tuple[str, ...]:
+        """
+        Collect metadata properties from the selected items (merged).
 
-            # Add special editable properties: Name and Clip Color
-            # "Name" uses SetName(), "Clip Color" uses SetClipColor()
-            self.editable_properties = ["Name", "Clip Color"] + self.metadata_properties
+        Args:
+            sample_size: Only scan the first N selected items (None scans all)
 
-        except Exception as e:
-            print(f"ERROR: Failed to get metadata: {e}")
-            return False
+        Returns:
+            Updated tuple of editable properties
+        """
+        # Same selection list as the last scan - the discovered properties still apply
+        # (unless a full scan is requested and the last one was only a sample)
+        if (self._discovered_items is not None
+                and self.selected_items is self._discovered_items
+                and (self.metadata_complete or sample_size is not None)):
+            return self.editable_properties
+
+        if sample_size is None:
+            items = self.selected_items
+        else:
+            items = self.selected_items[:sample_size]
 
-        return True
+        all_metadata_keys: set[str] = set()
+        for item in items:
+            metadata = self._get_metadata_cached(item)
+            if metadata:
+                all_metadata_keys.update(metadata.keys())
+
+        if not all_metadata_keys:
+            print("WARNING: No metadata available from any selected clip")
+
+        # Sort for consistent display order
+        self.metadata_properties = sorted(all_metadata_keys)
+        self.metadata_complete = len(items) == len(self.selected_items)
+
+        # Add special editable properties: Name and Clip Color
+        # "Name" uses SetName(), "Clip Color" uses SetClipColor()
+        # Frozen and interned: the combo box can't mutate it, and property name
+        # comparisons/lookups can short-circuit on identity
+        self.editable_properties = tuple(sys.intern(name) for name in ("Name", "Clip Color", *self.metadata_properties))
+        self._editable_set = set(self.editable_properties)
 
-    def refresh_metadata(self) -> list[str] | None:
+        self._discovered_items = self.selected_items
+
+        return self.editable_properties
+
+    def refresh_metadata(self, sample_size: int | None = None) -> tuple[str, ...] | None:
         """
         Refresh metadata properties from current Media Pool selection.
 
+        Args:
+            sample_size: Only scan the first N selected items (None scans all)
+
         Returns:
-            Updated list of editable properties, or None if no clips selected
+            Updated tuple of editable properties, or None if no clips selected
         """
         # Get current selection
         self.selected_items = self.media_pool.GetSelectedClips()
+        self.clear_cache()
         if not self.selected_items:
             return None
 
-        # Rebuild metadata from all selected items
-        all_metadata_keys: set[str] = set()
-        for item in self.selected_items:
-            metadata = item.GetMetadata()
-            if metadata:
-                all_metadata_keys.update(metadata.keys())
-
-        self.metadata_properties = sorted(all_metadata_keys) if all_metadata_keys else []
-        self.editable_properties = ["Name", "Clip Color"] + self.metadata_properties
-
-        return self.editable_properties
+        return self.discover_metadata_keys(sample_size)
 
     def _is_timeline(self, item: Any) -> bool:
         """
@@ -193,106 +293,166 @@ class TimelineMetadataEditor:
         except Exception:
             return False
 
-    def _get_timeline_from_item(self, item: Any) -> Any | None:
+    def _get_timeline_from_item(self, item: Any, timeline_name: str) -> Any | None:
         """
         Convert MediaPoolItem (timeline) to Timeline object.
 
         Args:
             item: Media pool item representing a timeline
+            timeline_name: Current name of the item
 
         Returns:
             Timeline object if found, None otherwise
         """
         try:
-            timeline_name = item.GetName()
             if not timeline_name:
                 return None
 
-            timeline_count = self.project.GetTimelineCount()
-            for idx in range(1, timeline_count + 1):  # 1-based indexing
-                timeline = self.project.GetTimelineByIndex(idx)
-                if timeline and timeline.GetName() == timeline_name:
-                    return timeline
-            return None
+            # Build the name map once instead of scanning all timelines per item
+            if self._timeline_by_name is None:
+                self._timeline_by_name = {}
+                timeline_count = self.project.GetTimelineCount()
+                for idx in range(1, timeline_count + 1):  # 1-based indexing
+                    timeline = self.project.GetTimelineByIndex(idx)
+                    if timeline:
+                        # Keep the first match, as the original index scan did
+                        self._timeline_by_name.setdefault(timeline.GetName(), timeline)
+            return self._timeline_by_name.get(timeline_name)
         except Exception:
             return None
 
-    def _process_item_property(self, item: Any, property_name: str, find_text: str, replace_text: str) -> tuple[bool, str]:
+    def _apply_metadata_updates(self, item: Any, updates: dict[str, str]) -> bool:
+        """
+        Write one or more metadata values to an item in a single SetMetadata() call.
+
+        Resolve has no bulk API across items, but SetMetadata accepts a dict, so
+        every key changed on one item costs a single round-trip.
+
+        Args:
+            item: Media pool item to update
+            updates: Metadata key -> new value
+
+        Returns:
+            True if Resolve accepted the update, False otherwise
+        """
+        result = item.SetMetadata(updates)
+        if result:
+            # Keep the cached dict in sync instead of re-reading it from Resolve
+            metadata = self._metadata_cache.get(id(item))
+            if metadata is not None:
+                metadata.update(updates)
+        return bool(result)
+
+    def _set_name(self, item: Any, old_value: str, new_value: str) -> bool:
+        """
+        Rename an item, going through the Timeline object for timeline items.
+
+        Args:
+            item: Media pool item to rename
+            old_value: Current name
+            new_value: New name
+
+        Returns:
+            True if the rename succeeded, False otherwise
+        """
+        # Check if this is a timeline - need special handling
+        if self._is_timeline(item):
+            timeline = self._get_timeline_from_item(item, old_value)
+            if not timeline:
+                print(f"  Error: Could not convert timeline MediaPoolItem to Timeline object")
+                return False
+            result = timeline.SetName(new_value)
+            if result:
+                if self._timeline_by_name is not None:
+                    self._timeline_by_name.pop(old_value, None)
+                    self._timeline_by_name[new_value] = timeline
+        else:
+            # Regular clip - use MediaPoolItem.SetName()
+            result = item.SetName(new_value)
+        return bool(result)
+
+    def _build_accessors(self, property_name: str) -> tuple[Callable[[Any], str], Callable[[Any, str, str], bool]]:
+        """
+        Bind getter/setter callables for a property once per find_and_replace run.
+
+        Args:
+            property_name: "Name", "Clip Color" or a metadata key
+
+        Returns:
+            Tuple of (get_fn(item) -> value, set_fn(item, old_value, new_value) -> success)
+        """
+        methods = _PROPERTY_METHODS.get(property_name)
+        if methods is not None:
+            getter_name, setter_name = methods
+            cache = self._value_caches[property_name]
+            # Resolved once per run; timeline items are renamed through their Timeline
+            if property_name == "Name":
+                write = self._set_name
+            else:
+                def write(item: Any, old_value: str, new_value: str) -> bool:
+                    return bool(getattr(item, setter_name)(new_value))
+
+            def get_value(item: Any) -> str:
+                key = id(item)
+                if key not in cache:
+                    cache[key] = getattr(item, getter_name)() or ""
+                return cache[key]
+
+            def set_value(item: Any, old_value: str, new_value: str) -> bool:
+                result = write(item, old_value, new_value)
+                if result:
+                    cache[id(item)] = new_value
+                return result
+
+            return get_value, set_value
+
+        def get_metadata_value(item: Any) -> str:
+            metadata = self._get_metadata_cached(item)
+            return metadata.get(property_name, "") if metadata else ""
+
+        def set_metadata_value(item: Any, old_value: str, new_value: str) -> bool:
+            return self._apply_metadata_updates(item, {property_name: new_value})
+
+        return get_metadata_value, set_metadata_value
+
+    def _process_item_property(self, item: Any, get_fn: Callable[[Any], str],
+                               set_fn: Callable[[Any, str, str], bool], find_text: str, replace_text: str,
+                               translation: dict[int, str | None] | None = None) -> tuple[bool, str]:
         """
         Process find/replace for a single item property.
 
+        Capability checks for the item's getter/setter are done once per run in
+        find_and_replace(), so a missing method here surfaces as AttributeError.
+
         Args:
             item: Media pool item to process
-            property_name: Property to modify
+            get_fn: Property getter bound by _build_accessors()
+            set_fn: Property setter bound by _build_accessors()
             find_text: Text to find
             replace_text: Text to replace with
+            translation: Optional str.translate table equivalent to the replacement
+                (built once per run for single-character find/replace)
 
         Returns:
             Tuple of (success: bool, status: 'modified'|'skipped'|'error')
         """
         try:
-            # Get current value based on property type
-            if property_name == "Name":
-                if not hasattr(item, 'GetName') or not callable(item.GetName):
-                    print(f"  Skipped: Item does not support GetName() method")
-                    return False, 'skipped'
-                current_value = item.GetName()
-                if current_value is None:
-                    current_value = ""
-            elif property_name == "Clip Color":
-                if not hasattr(item, 'GetClipColor') or not callable(item.GetClipColor):
-                    print(f"  Skipped: Item does not support GetClipColor() method")
-                    return False, 'skipped'
-                current_value = item.GetClipColor()
-                if current_value is None:
-                    current_value = ""
-            else:  # Metadata property
-                if not hasattr(item, 'GetMetadata') or not callable(item.GetMetadata):
-                    print(f"  Skipped: Item does not support GetMetadata() method")
-                    return False, 'skipped'
-                metadata = item.GetMetadata()
-                if metadata is None:
-                    return False, 'skipped'
-                current_value = metadata.get(property_name, "")
-
-            # Check if find_text exists
-            if find_text not in current_value:
-                return False, 'skipped'
+            current_value = get_fn(item)
 
-            # Perform replacement
-            new_value = current_value.replace(find_text, replace_text)
-
-            # Set new value based on property type
-            if property_name == "Name":
-                # Check if this is a timeline - need special handling
-                if self._is_timeline(item):
-                    timeline = self._get_timeline_from_item(item)
-                    if not timeline:
-                        print(f"  Error: Could not convert timeline MediaPoolItem to Timeline object")
-                        return False, 'error'
-                    if not hasattr(timeline, 'SetName') or not callable(timeline.SetName):
-                        print(f"  Error: Timeline does not support SetName() method")
-                        return False, 'error'
-                    result = timeline.SetName(new_value)
-                else:
-                    # Regular clip - use MediaPoolItem.SetName()
-                    if not hasattr(item, 'SetName') or not callable(item.SetName):
-                        print(f"  Error: Item does not support SetName() method")
-                        return False, 'error'
-                    result = item.SetName(new_value)
-            elif property_name == "Clip Color":
-                if not hasattr(item, 'SetClipColor') or not callable(item.SetClipColor):
-                    print(f"  Error: Item does not support SetClipColor() method")
-                    return False, 'error'
-                result = item.SetClipColor(new_value)
-            else:  # Metadata property
-                if not hasattr(item, 'SetMetadata') or not callable(item.SetMetadata):
-                    print(f"  Error: Item does not support SetMetadata() method")
-                    return False, 'error'
-                result = item.SetMetadata(property_name, new_value)
+            # Perform replacement - an unchanged value means find_text wasn't present
+            if translation is not None:
+                new_value = current_value.translate(translation)
+            else:
+                new_value = current_value.replace(find_text, replace_text)
+            if new_value == current_value:
+                return False, 'skipped'
 
+            result = set_fn(item, current_value, new_value)
             return result, 'modified' if result else 'error'
 
+        except AttributeError as e:
+            print(f"  Error: Item does not support required method: {e}")
+            return False, 'error'
         except Exception as e:
             print(f"ERROR processing item: {e}")
             return False, 'error'
@@ -313,34 +473,59 @@ class TimelineMetadataEditor:
             if not self.selected_items:
                 return False, "No items selected"
 
-            if not property_name or property_name not in self.editable_properties:
+            # No-op requests never touch the Resolve API
+            if not find_text:
+                return False, "Empty find text"
+            if find_text == replace_text:
+                return True, f"No changes needed across {len(self.selected_items)} item(s)"
+
+            if not property_name or property_name not in self._editable_set:
                 return False, f"Invalid property: {property_name}"
 
-            modified_count = 0
-            skipped_count = 0
-            error_count = 0
+            # Timeline name map is rebuilt on demand for each run
+            self._timeline_by_name = None
 
-            # Process each selected item
-            for item in self.selected_items:
-                success, status = self._process_item_property(item, property_name, find_text, replace_text)
+            # All selected items share the MediaPoolItem API, so probe capabilities once
+            required_methods = _PROPERTY_METHODS.get(property_name, _METADATA_METHODS)
+            probe = self.selected_items[0]
+            for method_name in required_methods:
+                if not callable(getattr(probe, method_name, None)):
+                    return False, f"Items do not support {method_name}() method"
 
-                if status == 'modified':
-                    modified_count += 1
-                elif status == 'skipped':
-                    skipped_count += 1
-                else:  # 'error'
-                    error_count += 1
+            get_fn, set_fn = self._build_accessors(property_name)
+            counts: Counter[str] = Counter()
+
+            # Pre-filter using cached values so items without a match never reach the API
+            candidates = []
+            for item in self.selected_items:
+                try:
+                    if find_text in get_fn(item):
+                        candidates.append(item)
+                    else:
+                        counts['skipped'] += 1
+                except Exception:
+                    # Let _process_item_property report the problem
+                    candidates.append(item)
+
+            # Single-character replacements can use a prebuilt translate table
+            translation = None
+            if len(find_text) == 1 and len(replace_text) <= 1:
+                translation = str.maketrans({find_text: replace_text or None})
+
+            # Bind everything that is constant for this run, so each call only takes the item
+            process = partial(self._process_item_property, get_fn=get_fn, set_fn=set_fn, find_text=find_text,
+                              replace_text=replace_text, translation=translation)
+
+            # One item at a time: these are mutating calls over a single Resolve
+            # connection, which is not documented as safe for concurrent use
+            counts.update(status for _, status in map(process, candidates))
 
             # Build result message
             total = len(self.selected_items)
-            message_parts = [
-                f"{modified_count} item(s) modified" if modified_count > 0 else None,
-                f"{skipped_count} skipped (text not found)" if skipped_count > 0 else None,
-                f"{error_count} error(s)" if error_count > 0 else None,
-            ]
-            message = f"{', '.join(filter(None, message_parts))} out of {total} total"
-
-            success = modified_count > 0
+            message_parts = [template.format(counts[status]) for status, template in _STATUS_TEMPLATES if counts[status]]
+            message = f"{', '.join(message_parts)} out of {total} total"
+
+            success = counts['modified'] > 0
             return success, message
 
         except Exception as e:
@@ -364,6 +549,8 @@ class FindReplaceDialog:
         self.ui = None
         self.disp = None
         self.window = None
+        # Items currently shown in PropertyCombo, to skip rebuilding it when unchanged
+        self._combo_items_cached: tuple[str, ...] = ()
 
     def create_dialog(self) -> bool:
         """
@@ -373,8 +560,6 @@ class FindReplaceDialog:
             True if successful, False otherwise
         """
         try:
-            import DaVinciResolveScript as dvr
-
             # Get Fusion and UIManager
             self.fusion = self.resolve.Fusion()
             if not self.fusion:
@@ -387,14 +572,14 @@ class FindReplaceDialog:
                 return False
 
             # Create UIDispatcher instance
-            self.disp = dvr.UIDispatcher(self.ui)
+            self.disp = _get_dvr().UIDispatcher(self.ui)
 
             # Get item count for display
             item_count = len(self.editor.selected_items)
             items_text = f"Processing {item_count} selected item(s) from Media Pool"
 
-            # Create dropdown items for metadata properties
-            combo_items = self.editor.editable_properties
+            # Create dropdown items for metadata properties (sampled for large selections)
+            combo_items = self.editor.discover_metadata_keys(METADATA_SAMPLE_SIZE)
 
             # Create dialog window
             self.window = self.disp.AddWindow({
@@ -425,6 +610,12 @@ class FindReplaceDialog:
                             "MinimumSize": [80, 30],
                             "ToolTip": "Refresh properties from current Media Pool selection",
                         }),
+                        self.ui.Button({
+                            "ID": "ScanAllButton",
+                            "Text": "Scan All",
+                            "MinimumSize": [80, 30],
+                            "ToolTip": "Collect metadata properties from every selected clip",
+                        }),
                     ]),
                     self.ui.VGap(5),
 
@@ -480,15 +671,21 @@ class FindReplaceDialog:
             itm = self.window.GetItems()
 
             # Populate combo box
-            itm["PropertyCombo"].AddItems(combo_items)
+            itm["PropertyCombo"].AddItems(list(combo_items))
             if combo_items:
                 itm["PropertyCombo"].SetCurrentText(combo_items[0])
+            self._combo_items_cached = combo_items
+
+            if not self.editor.metadata_complete:
+                itm["StatusLabel"].Text = (f"Properties sampled from first {METADATA_SAMPLE_SIZE} of "
+                                           f"{item_count} items - click Scan All for the rest")
 
             # Set up event handlers
             self.window.On.FindReplaceDialog.Close = lambda ev: self.on_close(ev)
             self.window.On.CloseButton.Clicked = lambda ev: self.on_close(ev)
             self.window.On.ReplaceButton.Clicked = lambda ev: self.on_replace(ev)
             self.window.On.RefreshButton.Clicked = lambda ev: self.on_refresh(ev)
+            self.window.On.ScanAllButton.Clicked = lambda ev: self.on_scan_all(ev)
 
             # Show window
             self.window.Show()
@@ -499,7 +696,8 @@ class FindReplaceDialog:
 
         except Exception as e:
             print(f"ERROR: Failed to create dialog: {e}")
-            traceback.print_exc()
+            if _DEBUG:
+                traceback.print_exc()
             return False
 
     def get_selection(self) -> bool:
@@ -522,6 +720,7 @@ class FindReplaceDialog:
 
             # Update editor's selection
             self.editor.selected_items = current_selection
+            self.editor.clear_cache()
 
             # Update the item count label
             itm = self.window.GetItems()
@@ -532,7 +731,8 @@ class FindReplaceDialog:
 
         except Exception as e:
             print(f"ERROR in get_selection: {e}")
-            traceback.print_exc()
+            if _DEBUG:
+                traceback.print_exc()
             return False
 
     def on_replace(self, ev: Any) -> None:
@@ -564,7 +764,8 @@ class FindReplaceDialog:
 
         except Exception as e:
             print(f"ERROR in on_replace: {e}")
-            traceback.print_exc()
+            if _DEBUG:
+                traceback.print_exc()
 
     def on_refresh(self, ev: Any) -> None:
         """Handle Refresh button click - update properties from current selection."""
@@ -572,18 +773,20 @@ class FindReplaceDialog:
             itm = self.window.GetItems()
 
             # Refresh metadata from current selection
-            new_properties = self.editor.refresh_metadata()
+            new_properties = self.editor.refresh_metadata(METADATA_SAMPLE_SIZE)
 
             if new_properties is None:
                 itm["StatusLabel"].Text = "ERROR: No clips selected in Media Pool"
                 itm["StatusLabel"].StyleSheet = "QLabel { color: red; }"
                 return
 
-            # Update combo box
-            itm["PropertyCombo"].Clear()
-            itm["PropertyCombo"].AddItems(new_properties)
-            if new_properties:
-                itm["PropertyCombo"].SetCurrentText(new_properties[0])
+            # Update combo box (only if the property list actually changed)
+            if new_properties != self._combo_items_cached:
+                itm["PropertyCombo"].Clear()
+                itm["PropertyCombo"].AddItems(list(new_properties))
+                if new_properties:
+                    itm["PropertyCombo"].SetCurrentText(new_properties[0])
+                self._combo_items_cached = new_properties
 
             # Update item count label
             item_count = len(self.editor.selected_items)
@@ -591,12 +794,41 @@ class FindReplaceDialog:
 
             # Update status
             metadata_count = len(self.editor.metadata_properties)
-            itm["StatusLabel"].Text = f"Refreshed: {metadata_count} metadata field(s) found"
+            sampled_note = "" if self.editor.metadata_complete else " (sampled - click Scan All for the rest)"
+            itm["StatusLabel"].Text = f"Refreshed: {metadata_count} metadata field(s) found{sampled_note}"
             itm["StatusLabel"].StyleSheet = "QLabel { color: green; }"
 
         except Exception as e:
             print(f"ERROR in on_refresh: {e}")
-            traceback.print_exc()
+            if _DEBUG:
+                traceback.print_exc()
+
+    def on_scan_all(self, ev: Any) -> None:
+        """Handle Scan All button click - collect properties from every selected clip."""
+        try:
+            itm = self.window.GetItems()
+
+            # Already-read items come from the editor's metadata cache
+            new_properties = self.editor.discover_metadata_keys()
+
+            if new_properties != self._combo_items_cached:
+                current_property = itm["PropertyCombo"].CurrentText
+                itm["PropertyCombo"].Clear()
+                itm["PropertyCombo"].AddItems(list(new_properties))
+                if current_property in new_properties:
+                    itm["PropertyCombo"].SetCurrentText(current_property)
+                elif new_properties:
+                    itm["PropertyCombo"].SetCurrentText(new_properties[0])
+                self._combo_items_cached = new_properties
+
+            metadata_count = len(self.editor.metadata_properties)
+            itm["StatusLabel"].Text = f"Scanned all items: {metadata_count} metadata field(s) found"
+            itm["StatusLabel"].StyleSheet = "QLabel { color: green; }"
+
+        except Exception as e:
+            print(f"ERROR in on_scan_all: {e}")
+            if _DEBUG:
+                traceback.print_exc()
 
     def on_close(self, ev: Any) -> None:
         """Handle window close."""
@@ -622,7 +854,6 @@ def main() -> bool:
         return False
 
     print(f"✓ Found {len(editor.selected_items)} selected item(s)")
-    print(f"✓ Found {len(editor.editable_properties)} editable properties (including Name and Clip Color)")
 
     # Create and show dialog
     print("\nOpening dialog...")
@@ -12,9 +12,16 @@ Requires DaVinci Resolve Studio for UI dialogs (console fallback for Free versio
 from __future__ import annotations
 from typing import Any
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import sys
 import os
+import json
 import platform
+import re
+import stat
+import time
+import traceback
 
 
 # ============================================================================
@@ -63,6 +70,97 @@ def get_resolve() -> Any | None:
         return None
 
 
+# ============================================================================
+# PROPERTY CACHE - Avoids repeated Resolve API reads per timeline item
+# ============================================================================
+
+# Keyed by id(timeline_item). Each entry keeps a reference to the item itself so
+# its id can't be reused by another object while cached. Cleared at the start of
+# every scan / preview / apply pass, since those re-fetch the track item lists.
+_item_cache: dict[int, tuple[Any, Any, str, dict[str, Any]]] = {}
+_clip_color_cache: dict[int, tuple[Any, str]] = {}
+
+# Clip properties keyed by media pool item GetMediaId(), so many cuts of the same
+# source clip share a single GetClipProperty() call
+_props_by_media_id: dict[str, dict[str, Any]] = {}
+
+
+def clear_property_cache() -> None:
+    """Drop all cached timeline item properties."""
+    _item_cache.clear()
+    _clip_color_cache.clear()
+    _props_by_media_id.clear()
+
+
+def _get_cached_entry(item: Any) -> tuple[Any, Any, str, dict[str, Any]]:
+    """Fetch (item, media_pool_item, media_id, clip_properties) once per timeline item."""
+    key = id(item)
+    entry = _item_cache.get(key)
+    if entry is None:
+        media_pool_item = item.GetMediaPoolItem()
+        media_id = ""
+        props: dict[str, Any] = {}
+        if media_pool_item:
+            media_id = media_pool_item.GetMediaId() or ""
+            cached_props = _props_by_media_id.get(media_id) if media_id else None
+            if cached_props is None:
+                props = media_pool_item.GetClipProperty() or {}
+                # Normalize on ingest so FrameRateRule checks are a plain lookup
+                get_normalized_frame_rate(props)
+                if media_id:
+                    _props_by_media_id[media_id] = props
+            else:
+                props = cached_props
+        entry = (item, media_pool_item, media_id, props)
+        _item_cache[key] = entry
+    return entry
+
+
+def _get_cached_media_pool_item(item: Any) -> Any | None:
+    """Get a timeline item's media pool item (None for generators, titles, etc.)."""
+    return _get_cached_entry(item)[1]
+
+
+def _get_cached_media_id(item: Any) -> str:
+    """Get the unique media ID of a timeline item's source clip ("" if none)."""
+    return _get_cached_entry(item)[2]
+
+
+def _get_cached_props(item: Any) -> dict[str, Any]:
+    """Get the clip properties of a timeline item's media pool item ({} if none)."""
+    return _get_cached_entry(item)[3]
+
+
+def _get_cached_clip_color(item: Any) -> str:
+    """Get a timeline item's clip color ("" if unset)."""
+    # TimelineItem.GetProperty() only exposes transform/crop/composite keys, not
+    # the clip color, so this stays a dedicated (cached) GetClipColor() call
+    key = id(item)
+    entry = _clip_color_cache.get(key)
+    if entry is None:
+        entry = (item, item.GetClipColor() or "")
+        _clip_color_cache[key] = entry
+    return entry[1]
+
+
+def get_video_track_items(timeline: Any) -> list[Any]:
+    """
+    Get all items on a timeline's video tracks.
+
+    Args:
+        timeline: Timeline to enumerate
+
+    Returns:
+        Items from every video track, in track order
+    """
+    video_track_count = timeline.GetTrackCount("video")
+    return [
+        item
+        for track_idx in range(1, video_track_count + 1)
+        for item in (timeline.GetItemListInTrack("video", track_idx) or [])
+    ]
+
+
 # ============================================================================
 # PROJECT SCANNER - Discovers property values from selected timelines
 # ============================================================================
@@ -78,6 +176,10 @@ class ProjectScanner:
             "frame_rates": set(),
             "clip_colors": set(),
         }
+        # Source clips (by media ID) whose properties were already collected
+        self._seen_media_ids: set[str] = set()
+        # Items whose properties couldn't be read, reported once after the scan
+        self._extract_failures = 0
 
     def scan_timelines(self) -> bool:
         """
@@ -92,18 +194,17 @@ class ProjectScanner:
                 return False
 
             print(f"Scanning {len(self.timelines)} selected timeline(s) for clip properties...")
+            clear_property_cache()
+            self._seen_media_ids.clear()
+            self._extract_failures = 0
 
-            for timeline in self.timelines:
-                timeline_name = timeline.GetName()
-                print(f"  Scanning: {timeline_name}")
-
-                # Scan all video tracks
-                video_track_count = timeline.GetTrackCount("video")
-                for track_idx in range(1, video_track_count + 1):
-                    items = timeline.GetItemListInTrack("video", track_idx)
+            # All Resolve calls stay on the calling thread
+            items_per_timeline = [get_video_track_items(timeline) for timeline in self.timelines]
 
-                    for item in items:
-                        self._extract_properties_from_item(item)
+            # Extract in timeline order so per-source deduplication stays deterministic
+            for timeline, all_items in zip(self.timelines, items_per_timeline):
+                print(f"  Scanning: {timeline.GetName()}")
+                self._extract_properties_from_items(all_items)
 
             # Report findings
             print(f"\nDiscovered properties:")
@@ -111,52 +212,60 @@ class ProjectScanner:
             print(f"  Resolutions: {len(self.discovered['resolutions'])}")
             print(f"  Frame Rates: {len(self.discovered['frame_rates'])}")
             print(f"  Clip Colors: {len(self.discovered['clip_colors'])}")
+            if self._extract_failures:
+                print(f"  Skipped {self._extract_failures} unreadable item(s)")
 
             return True
 
         except Exception as e:
             print(f"ERROR scanning timelines: {e}")
-            import traceback
             traceback.print_exc()
             return False
 
-    def _extract_properties_from_item(self, item: Any) -> None:
-        """Extract and store properties from a timeline item."""
-        try:
-            media_pool_item = item.GetMediaPoolItem()
-            if not media_pool_item:
-                return
-
-            # Get all properties at once
-            props = media_pool_item.GetClipProperty()
-            if not props:
-                return
-
-            # Extract codec
-            codec = props.get("Video Codec", "")
-            if codec and codec.strip():
-                self.discovered["codecs"].add(codec.strip())
-
-            # Extract resolution
-            resolution = props.get("Resolution", "")
-            if resolution and str(resolution).strip():
-                self.discovered["resolutions"].add(str(resolution).strip())
+    def _extract_properties_from_items(self, items: list[Any]) -> None:
+        """Extract properties from timeline items and store them in bulk."""
+        codecs: list[str] = []
+        resolutions: list[str] = []
+        frame_rates: list[str] = []
+        clip_colors: list[str] = []
 
-            # Extract frame rate
-            frame_rate = props.get("Frame Rate", "") or props.get("FPS", "")
-            if frame_rate:
-                # Normalize frame rate using helper function
-                normalized_fps = normalize_frame_rate(frame_rate)
-                self.discovered["frame_rates"].add(normalized_fps)
-
-            # Extract clip color (from timeline item, not media pool item)
-            clip_color = item.GetClipColor()
-            if clip_color and clip_color.strip():
-                self.discovered["clip_colors"].add(clip_color.strip())
-
-        except Exception:
-            # Silently skip items that can't be read
-            pass
+        for item in items:
+            try:
+                # Get all properties at once (cached for the rule checks that follow)
+                props = _get_cached_props(item)
+                if not props:
+                    continue
+
+                # Repeated cuts of one source clip only differ in clip color
+                media_id = _get_cached_media_id(item)
+                if not media_id or media_id not in self._seen_media_ids:
+                    if media_id:
+                        self._seen_media_ids.add(media_id)
+
+                    # Extract codec
+                    if codec := (props.get("Video Codec") or "").strip():
+                        codecs.append(codec)
+
+                    # Extract resolution
+                    if resolution := str(props.get("Resolution") or "").strip():
+                        resolutions.append(resolution)
+
+                    # Extract frame rate
+                    if normalized_fps := get_normalized_frame_rate(props):
+                        frame_rates.append(normalized_fps)
+
+                # Extract clip color (from timeline item, not media pool item)
+                if clip_color := _get_cached_clip_color(item).strip():
+                    clip_colors.append(clip_color)
+
+            except Exception:
+                # Skip items that can't be read; counted and reported after the scan
+                self._extract_failures += 1
+
+        self.discovered["codecs"].update(codecs)
+        self.discovered["resolutions"].update(resolutions)
+        self.discovered["frame_rates"].update(frame_rates)
+        self.discovered["clip_colors"].update(clip_colors)
 
     def get_discovered_values(self) -> dict[str, list[str]]:
         """
@@ -166,10 +275,10 @@ class ProjectScanner:
             Dictionary with sorted lists of values
         """
         return {
-            "codecs": sorted(list(self.discovered["codecs"])),
-            "resolutions": sorted(list(self.discovered["resolutions"])),
-            "frame_rates": sorted(list(self.discovered["frame_rates"])),
-            "clip_colors": sorted(list(self.discovered["clip_colors"])),
+            "codecs": sorted(self.discovered["codecs"]),
+            "resolutions": sorted(self.discovered["resolutions"]),
+            "frame_rates": sorted(self.discovered["frame_rates"]),
+            "clip_colors": sorted(self.discovered["clip_colors"]),
         }
 
 
@@ -177,12 +286,14 @@ class ProjectScanner:
 # HELPER FUNCTIONS
 # ============================================================================
 
+@lru_cache(maxsize=256)
 def normalize_frame_rate(frame_rate: str | int | float) -> str:
     """
     Normalize frame rate to consistent string format.
 
     Converts numeric frame rates to 3-decimal precision strings and strips
     trailing zeros for cleaner display (e.g., 24.000 -> "24", 23.976 -> "23.976").
+    Results are memoized, since projects only use a handful of distinct rates.
 
     Args:
         frame_rate: Frame rate as string, int, or float
@@ -211,6 +322,31 @@ def normalize_frame_rate(frame_rate: str | int | float) -> str:
         return str(frame_rate).strip()
 
 
+# Key under which get_normalized_frame_rate() memoizes its result in a props dict
+_NORMALIZED_FPS_KEY = "__norm_fps__"
+
+
+def get_normalized_frame_rate(props: dict[str, Any]) -> str:
+    """
+    Get the normalized frame rate from a clip property dict.
+
+    Reads "Frame Rate" (falling back to "FPS") and stores the normalized value
+    back on the dict, so later lookups on the same cached props are a single get.
+
+    Args:
+        props: Clip properties from GetClipProperty()
+
+    Returns:
+        Normalized frame rate string, or "" if the clip has none
+    """
+    normalized = props.get(_NORMALIZED_FPS_KEY)
+    if normalized is None:
+        frame_rate = props.get("Frame Rate") or props.get("FPS")
+        normalized = normalize_frame_rate(frame_rate) if frame_rate else ""
+        props[_NORMALIZED_FPS_KEY] = normalized
+    return normalized
+
+
 # ============================================================================
 # RULE CLASSES - Match clip properties
 # ============================================================================
@@ -222,6 +358,8 @@ class Rule(ABC):
         self.value = value
         self.lut_path = lut_path
         self.target_node = target_node
+        # Display name of the LUT, computed once for result details and previews
+        self.lut_basename = os.path.basename(lut_path) if lut_path else ""
 
     @abstractmethod
     def matches(self, item: Any) -> bool:
@@ -239,11 +377,7 @@ class CodecRule(Rule):
 
     def matches(self, item: Any) -> bool:
         try:
-            media_pool_item = item.GetMediaPoolItem()
-            if not media_pool_item:
-                return False
-
-            codec = media_pool_item.GetClipProperty("Video Codec")
+            codec = _get_cached_props(item).get("Video Codec")
             if not codec:
                 return False
 
@@ -253,9 +387,7 @@ class CodecRule(Rule):
 
     def get_property_value(self, item: Any) -> str:
         try:
-            media_pool_item = item.GetMediaPoolItem()
-            if media_pool_item:
-                return media_pool_item.GetClipProperty("Video Codec") or ""
+            return _get_cached_props(item).get("Video Codec") or ""
         except Exception:
             pass
         return ""
@@ -266,12 +398,7 @@ class ResolutionRule(Rule):
 
     def matches(self, item: Any) -> bool:
         try:
-            media_pool_item = item.GetMediaPoolItem()
-            if not media_pool_item:
-                return False
-
-            props = media_pool_item.GetClipProperty()
-            resolution = props.get("Resolution", "")
+            resolution = _get_cached_props(item).get("Resolution", "")
 
             if not resolution:
                 return False
@@ -282,12 +409,9 @@ class ResolutionRule(Rule):
 
     def get_property_value(self, item: Any) -> str:
         try:
-            media_pool_item = item.GetMediaPoolItem()
-            if media_pool_item:
-                props = media_pool_item.GetClipProperty()
-                resolution = props.get("Resolution", "")
-                if resolution:
-                    return str(resolution).strip()
+            resolution = _get_cached_props(item).get("Resolution", "")
+            if resolution:
+                return str(resolution).strip()
         except Exception:
             pass
         return ""
@@ -298,31 +422,19 @@ class FrameRateRule(Rule):
 
     def matches(self, item: Any) -> bool:
         try:
-            media_pool_item = item.GetMediaPoolItem()
-            if not media_pool_item:
-                return False
-
-            props = media_pool_item.GetClipProperty()
-            frame_rate = props.get("Frame Rate", "") or props.get("FPS", "")
+            # Normalized when the props were cached - no per-rule re-normalization
+            normalized_fps = _get_cached_props(item).get(_NORMALIZED_FPS_KEY)
 
-            if not frame_rate:
+            if not normalized_fps:
                 return False
 
-            # Normalize using helper function
-            normalized_fps = normalize_frame_rate(frame_rate)
             return normalized_fps == self.value
         except Exception:
             return False
 
     def get_property_value(self, item: Any) -> str:
         try:
-            media_pool_item = item.GetMediaPoolItem()
-            if media_pool_item:
-                props = media_pool_item.GetClipProperty()
-                frame_rate = props.get("Frame Rate", "") or props.get("FPS", "")
-                if frame_rate:
-                    # Normalize using helper function
-                    return normalize_frame_rate(frame_rate)
+            return get_normalized_frame_rate(_get_cached_props(item))
         except Exception:
             pass
         return ""
@@ -334,11 +446,10 @@ class ClipColorRule(Rule):
     def matches(self, item: Any) -> bool:
         try:
             # Only match media-based clips (skip generators, titles, etc.)
-            media_pool_item = item.GetMediaPoolItem()
-            if not media_pool_item:
+            if not _get_cached_media_pool_item(item):
                 return False
 
-            clip_color = item.GetClipColor()
+            clip_color = _get_cached_clip_color(item)
             if not clip_color:
                 return False
 
@@ -348,7 +459,7 @@ class ClipColorRule(Rule):
 
     def get_property_value(self, item: Any) -> str:
         try:
-            return item.GetClipColor() or ""
+            return _get_cached_clip_color(item)
         except Exception:
             pass
         return ""
@@ -358,12 +469,44 @@ class ClipColorRule(Rule):
 # LUT MANAGER - Scans and manages available LUTs
 # ============================================================================
 
+# Supported LUT file extensions (lowercase, including the dot)
+_LUT_EXTS = frozenset({'.cube', '.3dl', '.ilut', '.dat'})
+
+
+def _get_lut_ext(name: str) -> str:
+    """Get the lowercased extension of a file name, or empty string if it has none."""
+    dot = name.rfind('.')
+    return name[dot:].lower() if dot != -1 else ''
+
+
+def _get_mtime_ns(path: str) -> int | None:
+    """Get a path's modification time in nanoseconds, or None if it can't be read."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
 class LUTManager:
     """Manages LUT file discovery and validation."""
 
+    # Scan results shared across instances, keyed by LUT folder list.
+    # Each entry holds the scan start time, the mtime of every directory visited
+    # and the LUTs found.
+    _scan_cache: dict[tuple[str, ...], tuple[int, dict[str, int | None], list[str]]] = {}
+
+    # Same data persisted between runs, so a fresh launch can skip the walk too
+    INDEX_PATH = os.path.expanduser("~/.cache/resolve_add_luts.json")
+
+    # Coarsest directory mtime granularity to expect (FAT/exFAT use 2 seconds)
+    MTIME_RESOLUTION_NS = 2_000_000_000
+
     def __init__(self):
         self.lut_folders: list[str] = []
         self.available_luts: list[str] = []
+        self._by_name: dict[str, str] = {}  # display name (basename) -> full path
+        self._display_names_cache: list[str] | None = None
+        self._valid_path_cache: dict[str, bool] = {}
         self._setup_lut_folders()
 
     def _setup_lut_folders(self) -> None:
@@ -394,25 +537,145 @@ class LUTManager:
         Supported formats: .cube, .3dl, .ilut, .dat
 
         Returns:
-            List of full paths to LUT files
+            List of full paths to LUT files, sorted (the same list as available_luts)
         """
+        # Reuse the previous scan if no directory in the tree has changed - adding
+        # or removing an entry updates its parent directory's mtime
+        cache_key = tuple(self.lut_folders)
+        cached = LUTManager._scan_cache.get(cache_key) or self._load_index(cache_key)
+        if cached is not None:
+            scanned_ns, dir_mtimes, luts = cached
+            # A directory modified within one mtime tick of the scan may have changed
+            # again after it was read without its mtime moving, so it forces a rescan
+            racy_ns = scanned_ns - self.MTIME_RESOLUTION_NS
+            if all(_get_mtime_ns(d) == mtime and (mtime is None or mtime < racy_ns)
+                   for d, mtime in dir_mtimes.items()):
+                self.available_luts = list(luts)
+                self._index_luts()
+                self.available_luts.sort()
+                return self.available_luts
+
         self.available_luts = []
+        dir_mtimes = {}
+        scanned_ns = time.time_ns()
+
+        # Roots are independent trees and the work is syscall-bound, so scan them
+        # concurrently (map keeps the configured folder order)
+        if self.lut_folders:
+            with ThreadPoolExecutor(max_workers=len(self.lut_folders)) as executor:
+                for folder_mtimes, folder_luts in executor.map(self._scan_folder, self.lut_folders):
+                    dir_mtimes.update(folder_mtimes)
+                    self.available_luts.extend(folder_luts)
+
+        LUTManager._scan_cache[cache_key] = (scanned_ns, dir_mtimes, list(self.available_luts))
+        self._save_index(cache_key, scanned_ns, dir_mtimes, self.available_luts)
+        # Index in scan order (first found wins on duplicate names), then sort once in place
+        self._index_luts()
+        self.available_luts.sort()
+        return self.available_luts
+
+    @classmethod
+    def _load_index(cls, cache_key: tuple[str, ...]) -> tuple[int, dict[str, int | None], list[str]] | None:
+        """
+        Load the on-disk LUT index written by a previous run.
 
-        for folder in self.lut_folders:
-            if not os.path.exists(folder):
-                continue
+        Args:
+            cache_key: LUT folder list the index must have been built for
 
+        Returns:
+            Tuple of (scan start time, directory mtimes, LUT paths), or None if
+            there's no usable index
+        """
+        try:
+            with open(cls.INDEX_PATH, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("folders") != list(cache_key):
+                return None
+            scanned_ns = index["scanned_ns"]
+            dir_mtimes = index["dir_mtimes"]
+            luts = index["luts"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            return None
+
+        # The file may be hand-edited or written by an older version - never trust its shape
+        if not (isinstance(scanned_ns, int)
+                and isinstance(dir_mtimes, dict)
+                and all(mtime is None or isinstance(mtime, int) for mtime in dir_mtimes.values())
+                and isinstance(luts, list)
+                and all(isinstance(lut, str) for lut in luts)):
+            return None
+        return scanned_ns, dir_mtimes, luts
+
+    @classmethod
+    def _save_index(cls, cache_key: tuple[str, ...], scanned_ns: int,
+                    dir_mtimes: dict[str, int | None], luts: list[str]) -> None:
+        """Write the LUT index for the next run (best effort - failures are ignored)."""
+        try:
+            os.makedirs(os.path.dirname(cls.INDEX_PATH), exist_ok=True)
+            with open(cls.INDEX_PATH, "w", encoding="utf-8") as f:
+                json.dump({"folders": list(cache_key), "scanned_ns": scanned_ns,
+                           "dir_mtimes": dir_mtimes, "luts": luts}, f)
+        except (OSError, TypeError, ValueError):
+            pass
+
+    @staticmethod
+    def _scan_folder(folder: str) -> tuple[dict[str, int | None], list[str]]:
+        """
+        Recursively scan one LUT root folder (safe to run in worker threads).
+
+        Args:
+            folder: LUT root folder
+
+        Returns:
+            Tuple of ({directory: mtime_ns} for every directory visited, LUT paths found)
+        """
+        dir_mtimes: dict[str, int | None] = {}
+        luts: list[str] = []
+
+        # One stat covers the existence check and the cache signature
+        try:
+            folder_stat = os.stat(folder)
+        except OSError:
+            dir_mtimes[folder] = None
+            return dir_mtimes, luts
+        dir_mtimes[folder] = folder_stat.st_mtime_ns
+        if not stat.S_ISDIR(folder_stat.st_mode):
+            return dir_mtimes, luts
+
+        # Stack-based scandir traversal - DirEntry carries the file type from
+        # the directory listing, so no extra stat per entry (unlike os.walk)
+        stack = [folder]
+        while stack:
+            directory = stack.pop()
+            if directory not in dir_mtimes:
+                dir_mtimes[directory] = _get_mtime_ns(directory)
             try:
-                # os.walk() recursively traverses all subdirectories
-                for root, dirs, files in os.walk(folder):
-                    for file in files:
-                        if file.lower().endswith(('.cube', '.3dl', '.ilut', '.dat')):
-                            full_path = os.path.join(root, file)
-                            self.available_luts.append(full_path)
-            except Exception as e:
-                print(f"WARNING: Could not scan {folder}: {e}")
+                entries = os.scandir(directory)
+            except OSError as e:
+                print(f"WARNING: Could not scan {directory}: {e}")
+                continue
 
-        return sorted(self.available_luts)
+            with entries:
+                for entry in entries:
+                    # A single unreadable entry shouldn't cost the rest of the directory
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        stack.append(entry.path)
+                    elif _get_lut_ext(entry.name) in _LUT_EXTS:
+                        luts.append(entry.path)
+
+        return dir_mtimes, luts
+
+    def _index_luts(self) -> None:
+        """Map display names to paths. The first LUT found wins on duplicate names."""
+        self._by_name = {}
+        self._display_names_cache = None
+        self._valid_path_cache = {}
+        for lut in self.available_luts:
+            self._by_name.setdefault(os.path.basename(lut), lut)
 
     def get_lut_display_names(self) -> list[str]:
         """
@@ -422,8 +685,9 @@ class LUTManager:
         Returns:
             List of display names with removal option first, then sorted LUT files
         """
-        lut_names = sorted([os.path.basename(lut) for lut in self.available_luts])
-        return ["(None - Remove LUT)"] + lut_names
+        if self._display_names_cache is None:
+            self._display_names_cache = ["(None - Remove LUT)"] + sorted(self._by_name)
+        return self._display_names_cache
 
     def get_lut_path_by_display_name(self, display_name: str) -> str | None:
         """
@@ -440,10 +704,7 @@ class LUTManager:
             return ""
 
         # Regular LUT lookup
-        for lut in self.available_luts:
-            if os.path.basename(lut) == display_name:
-                return lut
-        return None
+        return self._by_name.get(display_name)
 
     def validate_lut_path(self, path: str) -> bool:
         """
@@ -459,10 +720,17 @@ class LUTManager:
         if path == "":
             return True
 
-        # Regular LUT file validation
-        if not path or not os.path.exists(path):
+        if not path:
             return False
-        return path.lower().endswith(('.cube', '.3dl', '.ilut', '.dat'))
+
+        # Results are kept until the next scan_luts, so the rule rows that are
+        # re-read on every UI event don't stat the same files each time
+        valid = self._valid_path_cache.get(path)
+        if valid is None:
+            # Extension first (only the extension is lowercased) so a wrong type skips the stat
+            valid = _get_lut_ext(path) in _LUT_EXTS and os.path.exists(path)
+            self._valid_path_cache[path] = valid
+        return valid
 
 
 # ============================================================================
@@ -476,6 +744,7 @@ class LUTApplier:
         self.resolve = resolve
         self.timelines = timelines
         self.rules = rules
+        self._rule_index = self._build_rule_index(rules)
         self.results: dict[str, Any] = {
             "clips_processed": 0,
             "clips_skipped": 0,
@@ -484,12 +753,57 @@ class LUTApplier:
             "details": []
         }
 
-    def apply_luts(self, verbose: bool = False) -> dict[str, Any]:
+    @staticmethod
+    def _build_rule_index(rules: list[Rule]) -> list[tuple[Rule, dict[str, tuple[int, Rule]]]]:
+        """
+        Index rules by rule type and matched value.
+
+        Returns:
+            One (representative rule, {value: (rule order, rule)}) pair per rule type.
+            The representative is only used to read the item's value for that type.
+        """
+        index: dict[type, tuple[Rule, dict[str, tuple[int, Rule]]]] = {}
+        for order, rule in enumerate(rules):
+            _, by_value = index.setdefault(type(rule), (rule, {}))
+            # Earlier rules win, as with a linear first-match scan
+            by_value.setdefault(rule.value, (order, rule))
+        return list(index.values())
+
+    def _find_matching_rule(self, item: Any) -> Rule | None:
+        """
+        Find the first rule (in configured order) that matches a timeline item.
+
+        Uses one hash lookup per rule type instead of testing every rule.
+        """
+        best: tuple[int, Rule] | None = None
+        for representative, by_value in self._rule_index:
+            candidate = by_value.get(representative.get_property_value(item))
+            if candidate and (best is None or candidate[0] < best[0]) and candidate[1].matches(item):
+                best = candidate
+        return best[1] if best else None
+
+    @staticmethod
+    def collect_timeline_items(timelines: list[Any]) -> list[tuple[str, list[Any]]]:
+        """
+        Enumerate the video track items of each timeline.
+
+        Args:
+            timelines: Timelines to enumerate
+
+        Returns:
+            List of (timeline name, items across all video tracks) pairs
+        """
+        return [(timeline.GetName(), get_video_track_items(timeline)) for timeline in timelines]
+
+    def apply_luts(self, verbose: bool = False,
+                   timeline_items: list[tuple[str, list[Any]]] | None = None) -> dict[str, Any]:
         """
         Apply LUTs to clips in timelines based on rules.
 
         Args:
             verbose: If True, print detailed progress
+            timeline_items: Prebuilt output of collect_timeline_items(), as for
+                preview_matches()
 
         Returns:
             Results dictionary with counts and details
@@ -498,20 +812,17 @@ class LUTApplier:
             print("WARNING: No rules configured")
             return self.results
 
-        for timeline in self.timelines:
-            timeline_name = timeline.GetName()
+        if timeline_items is None:
+            clear_property_cache()
+            timeline_items = self.collect_timeline_items(self.timelines)
+
+        for timeline_name, items in timeline_items:
             if verbose:
                 print(f"\nProcessing timeline: {timeline_name}")
 
-            # Process all video tracks
-            video_track_count = timeline.GetTrackCount("video")
-
-            for track_idx in range(1, video_track_count + 1):
-                items = timeline.GetItemListInTrack("video", track_idx)
-
-                for item in items:
-                    self.results["clips_processed"] += 1
-                    self._process_item(item, timeline_name, verbose)
+            for item in items:
+                self.results["clips_processed"] += 1
+                self._process_item(item, timeline_name, verbose)
 
         return self.results
 
@@ -521,7 +832,7 @@ class LUTApplier:
 
         # Check if this is a non-media clip (generator, title, etc.)
         try:
-            media_pool_item = item.GetMediaPoolItem()
+            media_pool_item = _get_cached_media_pool_item(item)
             is_media_clip = media_pool_item is not None
         except Exception:
             is_media_clip = False
@@ -533,66 +844,63 @@ class LUTApplier:
                 print(f"  ⊘ Skipped (generator/title): {item_name}")
             return
 
-        # Check item against all rules
-        matched_any_rule = False
-        for rule in self.rules:
-            if rule.matches(item):
-                matched_any_rule = True
-                # Rule matches - apply or remove LUT
-                success, status_msg = self._apply_lut_to_item(item, rule)
-
-                # Detect if this is a removal operation
-                is_removal = (rule.lut_path == "")
-                property_value = rule.get_property_value(item)
+        # Find the first matching rule - only one rule is applied per clip
+        rule = self._find_matching_rule(item)
+        if rule is None:
+            return
 
-                if success:
-                    self.results["luts_applied"] += 1
-
-                    if is_removal:
-                        # LUT removal
-                        if verbose:
-                            print(f"  ✓ Removed LUT from node {rule.target_node}: {item_name} ({property_value})")
-
-                        self.results["details"].append({
-                            "timeline": timeline_name,
-                            "clip": item_name,
-                            "property": property_value,
-                            "lut": "(Removed)",
-                            "target_node": rule.target_node,
-                            "success": True
-                        })
-                    else:
-                        # LUT application
-                        lut_name = os.path.basename(rule.lut_path)
-                        if verbose:
-                            print(f"  ✓ Applied {lut_name} to: {item_name} ({property_value})")
-
-                        self.results["details"].append({
-                            "timeline": timeline_name,
-                            "clip": item_name,
-                            "property": property_value,
-                            "lut": lut_name,
-                            "target_node": rule.target_node,
-                            "success": True
-                        })
-                else:
-                    self.results["errors"] += 1
-                    action = "remove LUT from" if is_removal else "apply LUT to"
-                    if verbose:
-                        print(f"  ✗ Failed to {action}: {item_name}")
-                        print(f"     Reason: {status_msg}")
-
-                    self.results["details"].append({
-                        "timeline": timeline_name,
-                        "clip": item_name,
-                        "lut": "(Removed)" if is_removal else os.path.basename(rule.lut_path),
-                        "target_node": rule.target_node,
-                        "error": status_msg,
-                        "success": False
-                    })
-
-                # Only apply first matching rule
-                break
+        # Rule matches - apply or remove LUT
+        success, status_msg = self._apply_lut_to_item(item, rule)
+
+        # Detect if this is a removal operation
+        is_removal = (rule.lut_path == "")
+        property_value = rule.get_property_value(item)
+
+        if success:
+            self.results["luts_applied"] += 1
+
+            if is_removal:
+                # LUT removal
+                if verbose:
+                    print(f"  ✓ Removed LUT from node {rule.target_node}: {item_name} ({property_value})")
+
+                self.results["details"].append({
+                    "timeline": timeline_name,
+                    "clip": item_name,
+                    "property": property_value,
+                    "lut": "(Removed)",
+                    "target_node": rule.target_node,
+                    "success": True
+                })
+            else:
+                # LUT application
+                lut_name = rule.lut_basename
+                if verbose:
+                    print(f"  ✓ Applied {lut_name} to: {item_name} ({property_value})")
+
+                self.results["details"].append({
+                    "timeline": timeline_name,
+                    "clip": item_name,
+                    "property": property_value,
+                    "lut": lut_name,
+                    "target_node": rule.target_node,
+                    "success": True
+                })
+        else:
+            self.results["errors"] += 1
+            action = "remove LUT from" if is_removal else "apply LUT to"
+            if verbose:
+                print(f"  ✗ Failed to {action}: {item_name}")
+                print(f"     Reason: {status_msg}")
+
+            self.results["details"].append({
+                "timeline": timeline_name,
+                "clip": item_name,
+                "lut": "(Removed)" if is_removal else rule.lut_basename,
+                "target_node": rule.target_node,
+                "error": status_msg,
+                "success": False
+            })
 
     def _apply_lut_to_item(self, item: Any, rule: Rule) -> tuple[bool, str]:
         """
@@ -607,7 +915,7 @@ class LUTApplier:
         """
         try:
             # 0. Check if clip supports color grading (defensive check)
-            media_pool_item = item.GetMediaPoolItem()
+            media_pool_item = _get_cached_media_pool_item(item)
             if not media_pool_item:
                 return False, "Clip is a generator/title (no color grading support)"
 
@@ -652,51 +960,46 @@ class LUTApplier:
             return True, "Removed" if is_removal else "Applied"
 
         except Exception as e:
-            # Capture the actual exception for debugging
-            import traceback
-            error_details = traceback.format_exc()
             return False, f"Exception: {str(e)}"
 
-    def preview_matches(self) -> list[dict[str, str]]:
+    def preview_matches(self, timeline_items: list[tuple[str, list[Any]]] | None = None) -> list[dict[str, str]]:
         """
         Preview which clips would be affected by rules.
 
+        Args:
+            timeline_items: Prebuilt output of collect_timeline_items(). When given,
+                the timelines are not re-enumerated and cached clip properties are
+                reused - the caller is responsible for keeping it current.
+
         Returns:
             List of dicts with clip info and matching rules
         """
         matches: list[dict[str, str]] = []
 
-        for timeline in self.timelines:
-            timeline_name = timeline.GetName()
-
-            # Process all video tracks
-            video_track_count = timeline.GetTrackCount("video")
+        if timeline_items is None:
+            clear_property_cache()
+            timeline_items = self.collect_timeline_items(self.timelines)
 
-            for track_idx in range(1, video_track_count + 1):
-                items = timeline.GetItemListInTrack("video", track_idx)
+        for timeline_name, items in timeline_items:
+            for item in items:
+                # Only the first matching rule applies
+                rule = self._find_matching_rule(item)
+                if rule is None:
+                    continue
 
-                for item in items:
-                    item_name = item.GetName()
-
-                    # Check against all rules
-                    for rule in self.rules:
-                        if rule.matches(item):
-                            property_value = rule.get_property_value(item)
-                            # Handle removal vs application
-                            if rule.lut_path == "":
-                                lut_name = "(Remove LUT)"
-                            else:
-                                lut_name = os.path.basename(rule.lut_path)
-
-                            matches.append({
-                                "timeline": timeline_name,
-                                "clip": item_name,
-                                "property": property_value,
-                                "lut": lut_name
-                            })
+                property_value = rule.get_property_value(item)
+                # Handle removal vs application
+                if rule.lut_path == "":
+                    lut_name = "(Remove LUT)"
+                else:
+                    lut_name = rule.lut_basename
 
-                            # Only first matching rule
-                            break
+                matches.append({
+                    "timeline": timeline_name,
+                    "clip": item.GetName(),
+                    "property": property_value,
+                    "lut": lut_name
+                })
 
         return matches
 
@@ -709,6 +1012,7 @@ class AddLUTDialog:
     """Manages the Add LUTs by Rules dialog UI."""
 
     MAX_RULES = 10  # Maximum number of rule rows
+    PREVIEW_DELAY_MS = 150  # Quiet period before a UI change refreshes the preview
 
     # Rule type constants
     RULE_TYPES = ["Codec", "Resolution", "Frame Rate", "Clip Color"]
@@ -746,11 +1050,82 @@ class AddLUTDialog:
         self.ui = None
         self.disp = None
         self.window = None
+        self._itm: dict[str, Any] | None = None  # Widget map, fetched once after window creation
+        self._preview_timer = None
+        # Last previewed rule set and text, to skip rebuilding an unchanged preview
+        self._last_preview_sig: tuple | None = None
+        self._last_preview_text: str | None = None
+        # Enumerated timeline items, reused by automatic previews on UI events
+        self._timeline_items_cache: list[tuple[str, list[Any]]] | None = None
+
+    def _get_items(self, refresh: bool = False) -> list[tuple[str, list[Any]]]:
+        """
+        Get the video track items of the selected timelines, enumerating them once.
+
+        Args:
+            refresh: If True, re-enumerate the timelines and drop cached clip properties
+
+        Returns:
+            List of (timeline name, items) pairs
+        """
+        if refresh or self._timeline_items_cache is None:
+            clear_property_cache()
+            self._timeline_items_cache = LUTApplier.collect_timeline_items(self.timelines)
+        return self._timeline_items_cache
+
+    # Shared widget options for rule rows (merged into each widget's ID-specific dict)
+    _CHECK_OPTS = {"Text": "", "Weight": 0, "MinimumSize": [25, 0]}
+    _LABEL_OPTS = {"Weight": 0, "MinimumSize": [50, 0]}
+    _TYPE_COMBO_OPTS = {"Weight": 0, "MinimumSize": [120, 0]}
+    _VALUE_COMBO_OPTS = {"Weight": 0, "MinimumSize": [180, 0]}
+    _LUT_COMBO_OPTS = {"Weight": 1, "MinimumSize": [200, 0]}
+    _NODE_SPIN_OPTS = {"Value": 1, "Minimum": 1, "Maximum": 10, "Weight": 0, "MinimumSize": [60, 0]}
+
+    def _build_rule_row(self, i: int) -> list[Any]:
+        """
+        Build the widgets for one rule row.
+
+        Args:
+            i: Row index (used in widget IDs)
+
+        Returns:
+            The row's HGroup followed by its spacing gap
+        """
+        ui = self.ui
+        return [
+            ui.HGroup([
+                ui.CheckBox({"ID": f"EnableRule_{i}", "Checked": (i == 0), **self._CHECK_OPTS}),
+                ui.HGap(5),
+                ui.Label({"Text": f"Rule {i+1}:", **self._LABEL_OPTS}),
+                ui.HGap(5),
+                ui.ComboBox({"ID": f"RuleType_{i}", **self._TYPE_COMBO_OPTS}),
+                ui.HGap(8),
+
+                # Stack widget to show property-specific dropdown, one page per
+                # rule type in RULE_STACK_INDEX order (Codec, Resolution, Frame Rate, Clip Color)
+                ui.Stack({"ID": f"PropertyStack_{i}", "Weight": 0}, [
+                    ui.ComboBox({"ID": f"{suffix}_{i}", **self._VALUE_COMBO_OPTS})
+                    for suffix in self.RULE_VALUE_WIDGETS.values()
+                ]),
+
+                ui.HGap(8),
+                ui.ComboBox({"ID": f"LUTValue_{i}", **self._LUT_COMBO_OPTS}),
+                ui.HGap(8),
+                ui.Label({"Text": "Node:", "Weight": 0}),
+                ui.SpinBox({"ID": f"NodeValue_{i}", **self._NODE_SPIN_OPTS}),
+            ]),
+            ui.VGap(15),
+        ]
 
     def create_dialog(self) -> bool:
         """Create and show the Add LUTs by Rules dialog."""
         try:
-            import DaVinciResolveScript
+            # Imported here so console mode never loads the UI bindings
+            try:
+                import DaVinciResolveScript
+            except ImportError as e:
+                print(f"UI bindings not available: {e}")
+                return False
 
             # Get Fusion and UIManager
             self.fusion = self.resolve.Fusion()
@@ -770,40 +1145,7 @@ class AddLUTDialog:
             timeline_count = len(self.timelines)
 
             # Build all rule rows
-            rule_rows = []
-            for i in range(self.MAX_RULES):
-                rule_rows.extend([
-                    self.ui.HGroup([
-                        self.ui.CheckBox({"ID": f"EnableRule_{i}", "Text": "", "Checked": (i == 0), "Weight": 0, "MinimumSize": [25, 0]}),
-                        self.ui.HGap(5),
-                        self.ui.Label({"Text": f"Rule {i+1}:", "Weight": 0, "MinimumSize": [50, 0]}),
-                        self.ui.HGap(5),
-                        self.ui.ComboBox({"ID": f"RuleType_{i}", "Weight": 0, "MinimumSize": [120, 0]}),
-                        self.ui.HGap(8),
-
-                        # Stack widget to show property-specific dropdown
-                        self.ui.Stack({"ID": f"PropertyStack_{i}", "Weight": 0}, [
-                            # Index 0: Codec dropdown
-                            self.ui.ComboBox({"ID": f"CodecValue_{i}", "Weight": 0, "MinimumSize": [180, 0]}),
-
-                            # Index 1: Resolution dropdown
-                            self.ui.ComboBox({"ID": f"ResolutionValue_{i}", "Weight": 0, "MinimumSize": [180, 0]}),
-
-                            # Index 2: Frame Rate dropdown
-                            self.ui.ComboBox({"ID": f"FrameRateValue_{i}", "Weight": 0, "MinimumSize": [180, 0]}),
-
-                            # Index 3: Clip Color dropdown
-                            self.ui.ComboBox({"ID": f"ClipColorValue_{i}", "Weight": 0, "MinimumSize": [180, 0]}),
-                        ]),
-
-                        self.ui.HGap(8),
-                        self.ui.ComboBox({"ID": f"LUTValue_{i}", "Weight": 1, "MinimumSize": [200, 0]}),
-                        self.ui.HGap(8),
-                        self.ui.Label({"Text": "Node:", "Weight": 0}),
-                        self.ui.SpinBox({"ID": f"NodeValue_{i}", "Value": 1, "Minimum": 1, "Maximum": 10, "Weight": 0, "MinimumSize": [60, 0]}),
-                    ]),
-                    self.ui.VGap(15),
-                ])
+            rule_rows = [widget for i in range(self.MAX_RULES) for widget in self._build_rule_row(i)]
 
             # Create dialog window
             self.window = self.disp.AddWindow({
@@ -891,16 +1233,32 @@ class AddLUTDialog:
                 ]),
             ])
 
+            # Widget lookups go through this single GetItems() result from here on
+            self._itm = self.window.GetItems()
+
             # Set up event handlers
             self.window.On.AddLUTDialog.Close = lambda ev: self.on_close(ev)
             self.window.On.CloseButton.Clicked = lambda ev: self.on_close(ev)
             self.window.On.PreviewButton.Clicked = lambda ev: self.on_preview(ev)
             self.window.On.ApplyButton.Clicked = lambda ev: self.on_apply(ev)
 
+            # Single-shot timer that coalesces bursts of UI changes into one preview.
+            # It fires on the UI thread, so the preview can touch widgets directly.
+            try:
+                self._preview_timer = self.ui.Timer({
+                    "ID": "PreviewTimer",
+                    "Interval": self.PREVIEW_DELAY_MS,
+                    "SingleShot": True,
+                })
+                self.disp.On.Timeout = lambda ev: self.update_preview()
+            except Exception as e:
+                print(f"WARNING: Preview timer unavailable, previews will update immediately: {e}")
+                self._preview_timer = None
+
             # Set up event handlers for all rules
             for i in range(self.MAX_RULES):
                 self.window.On[f"RuleType_{i}"].CurrentIndexChanged = lambda ev, idx=i: self.on_rule_type_changed(ev, idx)
-                self.window.On[f"EnableRule_{i}"].Clicked = lambda ev: self.update_preview()
+                self.window.On[f"EnableRule_{i}"].Clicked = lambda ev: self._schedule_preview()
 
             # Initialize row widgets with dropdown options
             self.initialize_row_widgets()
@@ -915,19 +1273,20 @@ class AddLUTDialog:
             # Show window
             self.window.Show()
             self.disp.RunLoop()
+            if self._preview_timer:
+                self._preview_timer.Stop()
             self.window.Hide()
 
             return True
 
         except Exception as e:
             print(f"ERROR: Failed to create dialog: {e}")
-            import traceback
             traceback.print_exc()
             return False
 
     def initialize_row_widgets(self) -> None:
         """Initialize row widgets with options after window is created."""
-        itm = self.window.GetItems()
+        itm = self._itm
 
         # Get LUT display names
         lut_names = self.lut_manager.get_lut_display_names()
@@ -986,11 +1345,18 @@ class AddLUTDialog:
     def on_rule_type_changed(self, ev: Any, row_index: int) -> None:
         """Handle rule type dropdown change."""
         self.update_rule_ui(row_index)
-        self.update_preview()
+        self._schedule_preview()
+
+    def _schedule_preview(self) -> None:
+        """Refresh the preview once UI changes settle (restarts the pending timer)."""
+        if self._preview_timer:
+            self._preview_timer.Start()
+        else:
+            self.update_preview()
 
     def update_rule_ui(self, row_index: int) -> None:
         """Update UI visibility based on rule type using Stack widget."""
-        itm = self.window.GetItems()
+        itm = self._itm
         rule_type = itm[f"RuleType_{row_index}"].CurrentText
 
         # Get the Stack widget for this row and set its index
@@ -999,7 +1365,7 @@ class AddLUTDialog:
 
     def get_rule_configs(self) -> list[Rule]:
         """Get configured rules from enabled rows."""
-        itm = self.window.GetItems()
+        itm = self._itm
         rules: list[Rule] = []
 
         for i in range(self.MAX_RULES):
@@ -1035,49 +1401,72 @@ class AddLUTDialog:
 
         return rules
 
-    def update_preview(self) -> None:
-        """Update the preview text area."""
+    def update_preview(self, refresh: bool = False) -> None:
+        """
+        Update the preview text area.
+
+        Args:
+            refresh: If True, re-enumerate timeline items instead of using the cache
+        """
         try:
-            itm = self.window.GetItems()
+            itm = self._itm
+
+            # Cheap check of the checkboxes before reading every row's widgets
+            if not any(itm[f"EnableRule_{i}"].Checked for i in range(self.MAX_RULES)):
+                self._last_preview_sig = None
+                self._set_preview_text(itm, "No rules configured")
+                return
+
             rules = self.get_rule_configs()
 
             if not rules:
-                itm["PreviewText"].PlainText = "No rules configured"
+                self._last_preview_sig = None
+                self._set_preview_text(itm, "No rules configured")
+                return
+
+            # Same rules over the same cached items give the same preview
+            sig = tuple((type(r), r.value, r.lut_path, r.target_node) for r in rules)
+            if not refresh and sig == self._last_preview_sig:
                 return
+            self._last_preview_sig = sig
 
             # Get preview matches
             applier = LUTApplier(self.resolve, self.timelines, rules)
-            matches = applier.preview_matches()
+            matches = applier.preview_matches(self._get_items(refresh))
 
             if not matches:
-                itm["PreviewText"].PlainText = "No clips match the configured rules"
+                self._set_preview_text(itm, "No clips match the configured rules")
                 return
 
-            # Build preview text
-            preview_lines = []
-            preview_lines.append(f"Found {len(matches)} clip(s) that will be affected:\n")
-
-            for match in matches:
-                preview_lines.append(f"Timeline: {match['timeline']}")
-                preview_lines.append(f"  Clip: {match['clip']}")
-                preview_lines.append(f"  Property: {match['property']}")
-                preview_lines.append(f"  LUT: {match['lut']}")
-                preview_lines.append("")
-
-            preview_text = "\n".join(preview_lines)
-            itm["PreviewText"].PlainText = preview_text
+            # Build preview text - one formatted block per match, joined in a single pass
+            preview_text = f"Found {len(matches)} clip(s) that will be affected:\n\n" + "\n".join(
+                f"Timeline: {match['timeline']}\n"
+                f"  Clip: {match['clip']}\n"
+                f"  Property: {match['property']}\n"
+                f"  LUT: {match['lut']}\n"
+                for match in matches
+            )
+            self._set_preview_text(itm, preview_text)
 
         except Exception as e:
+            # Don't let a failed build suppress the next attempt
+            self._last_preview_sig = None
             print(f"ERROR in update_preview: {e}")
-            import traceback
             traceback.print_exc()
 
+    def _set_preview_text(self, itm: Any, text: str) -> None:
+        """Write the preview text area, skipping the redraw if the text is unchanged."""
+        if text != self._last_preview_text:
+            itm["PreviewText"].PlainText = text
+            self._last_preview_text = text
+
     def on_preview(self, ev: Any) -> None:
         """Handle Preview button click."""
         try:
-            self.update_preview()
+            # Explicit preview picks up any timeline edits made since the last one
+            self.update_preview(refresh=True)
 
-            itm = self.window.GetItems()
+            itm = self._itm
             itm["StatusLabel"].Text = "✓ Preview updated"
             itm["StatusLabel"].StyleSheet = "QLabel { color: green; }"
 
@@ -1087,7 +1476,7 @@ class AddLUTDialog:
     def on_apply(self, ev: Any) -> None:
         """Handle Apply button click."""
         try:
-            itm = self.window.GetItems()
+            itm = self._itm
             rules = self.get_rule_configs()
 
             if not rules:
@@ -1097,7 +1486,8 @@ class AddLUTDialog:
 
             # Apply LUTs
             applier = LUTApplier(self.resolve, self.timelines, rules)
-            results = applier.apply_luts(verbose=True)
+            # Enumerate once for both the apply and the preview refresh that follows
+            results = applier.apply_luts(verbose=True, timeline_items=self._get_items(refresh=True))
 
             # Update status
             message = f"✓ Processed {results['clips_processed']} clips, applied {results['luts_applied']} LUTs"
@@ -1124,12 +1514,12 @@ class AddLUTDialog:
 
             itm["StatusLabel"].Text = message
 
-            # Update preview to show what was done
+            # Update preview to show what was done (items were just re-enumerated)
+            self._last_preview_sig = None
             self.update_preview()
 
         except Exception as e:
             print(f"ERROR in on_apply: {e}")
-            import traceback
             traceback.print_exc()
 
     def on_close(self, ev: Any) -> None:
@@ -1141,6 +1531,15 @@ class AddLUTDialog:
 # CONSOLE FALLBACK - For Resolve Free version
 # ============================================================================
 
+def _summarize_values(values: list[str] | None, limit: int = 20) -> str:
+    """Join discovered values for display, showing at most `limit` of them."""
+    if not values:
+        return "(none)"
+    if len(values) <= limit:
+        return ", ".join(values)
+    return ", ".join(values[:limit]) + f" ... (+{len(values) - limit})"
+
+
 def console_mode(resolve: Any, timelines: list[Any], discovered_values: dict[str, list[str]], lut_manager: LUTManager) -> bool:
     """
     Console-based mode for Resolve Free version.
@@ -1154,30 +1553,38 @@ def console_mode(resolve: Any, timelines: list[Any], discovered_values: dict[str
     Returns:
         True if successful
     """
-    print("\n" + "=" * 70)
-    print("  Add LUTs by Rules - Console Mode")
-    print("=" * 70)
-    print("\nUIManager not available (Resolve Free or Studio not running)")
-    print("Using console mode with predefined codec-to-LUT mappings")
-
-    # Show discovered values
-    print("\nDiscovered properties in project:")
-    print(f"  Codecs: {', '.join(discovered_values.get('codecs', ['(none)']))}")
-    print(f"  Resolutions: {', '.join(discovered_values.get('resolutions', ['(none)']))}")
-    print(f"  Frame Rates: {', '.join(discovered_values.get('frame_rates', ['(none)']))}")
-    print(f"  Clip Colors: {', '.join(discovered_values.get('clip_colors', ['(none)']))}")
+    # Collect the whole report and write it in one go
+    lines: list[str] = [
+        "\n" + "=" * 70,
+        "  Add LUTs by Rules - Console Mode",
+        "=" * 70,
+        "\nUIManager not available (Resolve Free or Studio not running)",
+        "Using console mode with predefined codec-to-LUT mappings",
+    ]
+
+    # Show discovered values (each list joined once, long lists capped)
+    summary = {
+        key: _summarize_values(discovered_values.get(key))
+        for key in ("codecs", "resolutions", "frame_rates", "clip_colors")
+    }
+    lines.append("\nDiscovered properties in project:")
+    lines.append(f"  Codecs: {summary['codecs']}")
+    lines.append(f"  Resolutions: {summary['resolutions']}")
+    lines.append(f"  Frame Rates: {summary['frame_rates']}")
+    lines.append(f"  Clip Colors: {summary['clip_colors']}")
 
     # Show available LUTs
     lut_names = lut_manager.get_lut_display_names()
-    print(f"\nAvailable LUTs ({len(lut_names)}):")
+    lines.append(f"\nAvailable LUTs ({len(lut_names)}):")
     for idx, lut in enumerate(lut_names[:10], 1):  # Show first 10
-        print(f"  {idx}. {lut}")
+        lines.append(f"  {idx}. {lut}")
     if len(lut_names) > 10:
-        print(f"  ... and {len(lut_names) - 10} more")
+        lines.append(f"  ... and {len(lut_names) - 10} more")
 
-    print("\nTo use this script with full UI, please run DaVinci Resolve Studio")
-    print("or edit this script to add predefined codec-to-LUT mappings.")
+    lines.append("\nTo use this script with full UI, please run DaVinci Resolve Studio")
+    lines.append("or edit this script to add predefined codec-to-LUT mappings.")
 
+    sys.stdout.write("\n".join(lines) + "\n")
     return True
 
 
@@ -1185,11 +1592,20 @@ def console_mode(resolve: Any, timelines: list[Any], discovered_values: dict[str
 # MAIN FUNCTION
 # ============================================================================
 
+# Media pool "Type" values of timelines and compound clips (exact-match fast path)
+_TIMELINE_TYPES = frozenset({"Timeline", "Compound", "Compound Clip", "Nested Timeline"})
+# Fallback for decorated Type strings from other Resolve versions
+_TIMELINE_TYPE_RE = re.compile(r"Timeline|Compound")
+
+
+def _is_timeline_type(item_type: str) -> bool:
+    """Check whether a media pool item Type string denotes a timeline or compound clip."""
+    return item_type in _TIMELINE_TYPES or _TIMELINE_TYPE_RE.search(item_type) is not None
+
+
 def main() -> bool:
     """Main function."""
-    print("\n" + "=" * 70)
-    print("  Add LUTs by Rules")
-    print("=" * 70)
+    sys.stdout.write("\n" + "=" * 70 + "\n  Add LUTs by Rules\n" + "=" * 70 + "\n")
 
     # Connect to Resolve
     resolve = get_resolve()
@@ -1227,30 +1643,41 @@ def main() -> bool:
     # Get timeline names from selected MediaPoolItems
     # MediaPoolItems that represent timelines need to be converted to Timeline objects
     timeline_names: list[str] = []
-    non_timeline_items: list[str] = []
+    # Non-timeline items abort the run, so only the first few names (for the
+    # error message) are fetched; the rest are just counted
+    first_bad: list[str] = []
+    bad_count = 0
 
     for item in selected_items:
         try:
-            # Check if item is a timeline by looking at its properties
-            props = item.GetClipProperty()
-            if props:
-                # Check if Type indicates it's a timeline
-                item_type = props.get("Type", "")
-                if "Timeline" in str(item_type) or "Compound" in str(item_type):
-                    timeline_names.append(item.GetName())
-                else:
-                    non_timeline_items.append(item.GetName())
-            else:
-                non_timeline_items.append(item.GetName())
+            # Check if item is a timeline by its Type - fetch only that property
+            # rather than the item's full property dict
+            item_type = item.GetClipProperty("Type") or ""
+            if isinstance(item_type, dict):  # Some API versions wrap it in a dict
+                item_type = item_type.get("Type", "")
+            is_timeline = _is_timeline_type(str(item_type))
         except Exception:
-            non_timeline_items.append(item.GetName() if hasattr(item, 'GetName') else "Unknown")
+            is_timeline = False
+
+        if is_timeline:
+            # Timeline names are only needed if the whole selection is valid
+            if not bad_count:
+                timeline_names.append(item.GetName())
+            continue
 
-    if non_timeline_items:
-        print(f"ERROR: {len(non_timeline_items)} non-timeline item(s) selected:")
-        for name in non_timeline_items[:5]:  # Show first 5
+        bad_count += 1
+        if len(first_bad) < 5:
+            try:
+                first_bad.append(item.GetName())
+            except Exception:
+                first_bad.append("Unknown")
+
+    if bad_count:
+        print(f"ERROR: {bad_count} non-timeline item(s) selected:")
+        for name in first_bad:  # Show first 5
             print(f"  - {name}")
-        if len(non_timeline_items) > 5:
-            print(f"  ... and {len(non_timeline_items) - 5} more")
+        if bad_count > len(first_bad):
+            print(f"  ... and {bad_count - len(first_bad)} more")
         print("\nPlease select only timeline items from the Media Pool")
         return False
 
@@ -1264,16 +1691,19 @@ def main() -> bool:
     timelines: list[Any] = []
     timeline_count = project.GetTimelineCount()
 
+    # Enumerate project timelines once, then match names by lookup. Names map to
+    # lists in project order so duplicate names resolve to distinct timelines.
+    timelines_by_name: dict[str, list[Any]] = {}
+    for idx in range(1, timeline_count + 1):
+        timeline = project.GetTimelineByIndex(idx)
+        if timeline:
+            timelines_by_name.setdefault(timeline.GetName(), []).append(timeline)
+
     for timeline_name in timeline_names:
-        found = False
-        for idx in range(1, timeline_count + 1):
-            timeline = project.GetTimelineByIndex(idx)
-            if timeline and timeline.GetName() == timeline_name:
-                timelines.append(timeline)
-                found = True
-                break
-
-        if not found:
+        candidates = timelines_by_name.get(timeline_name)
+        if candidates:
+            timelines.append(candidates.pop(0))
+        else:
             print(f"WARNING: Could not find timeline '{timeline_name}' in project")
 
     if not timelines:
@@ -1293,8 +1723,9 @@ def main() -> bool:
 
     discovered_values = scanner.get_discovered_values()
 
-    # Check if any properties were found
-    if not any(discovered_values.values()):
+    # Check if any properties were found (any() stops at the first non-empty list)
+    has_properties = any(discovered_values.values())
+    if not has_properties:
         print("WARNING: No clip properties discovered in project")
         print("         Make sure your timelines contain clips with video")
         return False
@@ -1317,7 +1748,9 @@ def main() -> bool:
 
     try:
         dialog = AddLUTDialog(resolve, timelines, discovered_values, lut_manager)
-        dialog.create_dialog()
+        if not dialog.create_dialog():
+            print("Falling back to console mode...")
+            console_mode(resolve, timelines, discovered_values, lut_manager)
     except Exception as e:
         print(f"Could not create UI dialog: {e}")
         print("Falling back to console mode...")
@@ -9,45 +9,58 @@ Supported Components:
 - Column Data: Pull from clip properties (Name, Clip Color, metadata)
 """
 from __future__ import annotations
-from typing import Any
+from typing import Any, Callable
 from abc import ABC, abstractmethod
 import sys
 import os
 import platform
 
 
-def add_resolve_module_path() -> bool:
-    """Add DaVinci Resolve's module path to sys.path."""
+def _get_module_path() -> str | None:
+    """Get DaVinci Resolve's scripting module path for this platform."""
     os_name = platform.system()
 
     if os_name == "Darwin":  # macOS
-        module_path = "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules/"
+        return "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules/"
     elif os_name == "Windows":
         programdata = os.environ.get('PROGRAMDATA', 'C:/ProgramData')
-        module_path = os.path.join(programdata,
-                                   "Blackmagic Design",
-                                   "DaVinci Resolve",
-                                   "Support",
-                                   "Developer",
-                                   "Scripting",
-                                   "Modules")
+        return os.path.join(programdata,
+                            "Blackmagic Design",
+                            "DaVinci Resolve",
+                            "Support",
+                            "Developer",
+                            "Scripting",
+                            "Modules")
     elif os_name == "Linux":
-        module_path = "/opt/resolve/Developer/Scripting/Modules/"
-    else:
-        return False
+        return "/opt/resolve/Developer/Scripting/Modules/"
+    return None
 
-    if module_path not in sys.path:
-        sys.path.insert(0, module_path)
-    return True
+
+# Resolved once at import time - the platform doesn't change during a session
+_MODULE_PATH = _get_module_path()
+
+
+def add_resolve_module_path() -> bool:
+    """Add DaVinci Resolve's module path to sys.path."""
+    if _MODULE_PATH and _MODULE_PATH not in sys.path:
+        sys.path.insert(0, _MODULE_PATH)
+    return _MODULE_PATH is not None
+
+
+# DaVinciResolveScript module, bound by get_resolve() and reused by the dialog
+_dvr: Any | None = None
 
 
 def get_resolve() -> Any | None:
     """Get the DaVinci Resolve scripting API object."""
+    global _dvr
     add_resolve_module_path()
 
     try:
-        import DaVinciResolveScript as dvr_script
-        resolve = dvr_script.scriptapp("Resolve")
+        if _dvr is None:
+            import DaVinciResolveScript as dvr_script
+            _dvr = dvr_script
+        resolve = _dvr.scriptapp("Resolve")
         if not resolve:
             print("ERROR: Could not connect to DaVinci Resolve.")
             return None
@@ -57,18 +70,86 @@ def get_resolve() -> Any | None:
         return None
 
 
+def _get_dvr() -> Any:
+    """Get the DaVinciResolveScript module, importing it if get_resolve() wasn't used."""
+    global _dvr
+    if _dvr is None:
+        add_resolve_module_path()
+        import DaVinciResolveScript as dvr_script
+        _dvr = dvr_script
+    return _dvr
+
+
+class ClipInfo:
+    """
+    Clip data used while generating names, fetched from Resolve on first use.
+
+    One instance per selected clip, kept until the selection is re-read, so each
+    Resolve call is made at most once per clip no matter how many components or
+    preview passes read the value.
+    """
+
+    __slots__ = ("item", "_name", "_metadata", "_clip_color")
+
+    def __init__(self, item: Any, name: str | None = None):
+        self.item = item
+        self._name = name
+        self._metadata: dict[str, Any] | None = None
+        self._clip_color: str | None = None
+
+    # Resolve errors are caught here, where the API is called, so components
+    # reading these values need no exception handling of their own
+
+    @property
+    def name(self) -> str:
+        """Clip name ("" if unavailable)."""
+        if self._name is None:
+            try:
+                self._name = self.item.GetName() or ""
+            except Exception:
+                self._name = ""
+        return self._name
+
+    def set_name(self, name: str) -> None:
+        """Record a name the clip was renamed to, so later reads don't call Resolve."""
+        self._name = name
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        """Clip metadata ({} if none)."""
+        if self._metadata is None:
+            try:
+                self._metadata = self.item.GetMetadata() or {}
+            except Exception:
+                self._metadata = {}
+        return self._metadata
+
+    @property
+    def clip_color(self) -> str:
+        """Clip color ("" if unset)."""
+        if self._clip_color is None:
+            try:
+                self._clip_color = self.item.GetClipProperty("Clip Color") or ""
+            except Exception:
+                self._clip_color = ""
+        return self._clip_color
+
+
 class Component(ABC):
     """Abstract base class for name components."""
 
+    # Subclasses declare their own slots (no per-instance __dict__)
+    __slots__ = ()
+
     @abstractmethod
-    def generate(self, item: Any, index: int, previous_result: str) -> str:
+    def generate(self, info: ClipInfo, index: int, previous_result: str) -> str:
         """
         Generate component output.
 
         Args:
-            item: Media pool item
+            info: Cached data of the media pool item
             index: Index of item in selection (for counter)
-            previous_result: Result from previous component
+            previous_result: Output of the previous component ("" for the first)
 
         Returns:
             String output for this component
@@ -79,50 +160,80 @@ class Component(ABC):
 class CounterComponent(Component):
     """Sequential number component."""
 
+    __slots__ = ("start", "padding", "increment", "_fmt")
+
     def __init__(self, start: int = 1, padding: int = 3, increment: int = 1):
         self.start = start
         self.padding = padding
         self.increment = increment
+        # Zero-padded formatter specialized once for this padding
+        self._fmt = f"{{:0{padding}d}}".format
 
-    def generate(self, item: Any, index: int, previous_result: str) -> str:
+    def generate(self, info: ClipInfo, index: int, previous_result: str) -> str:
         """Generate counter value."""
-        value = self.start + (index * self.increment)
-        return str(value).zfill(self.padding)
+        return self._fmt(self.start + index * self.increment)
+
+    def precomputed(self, count: int) -> Callable[[ClipInfo, int, str], str]:
+        """
+        Get a generate() equivalent backed by precomputed values.
+
+        Args:
+            count: Number of items in the rename pass
+
+        Returns:
+            Function returning the counter string for index 0..count-1 by lookup
+        """
+        fmt, start, increment = self._fmt, self.start, self.increment
+        values = [fmt(start + index * increment) for index in range(count)]
+        return lambda info, index, previous_result: values[index]
 
 
 class SpecifiedTextComponent(Component):
     """Custom text component."""
 
+    __slots__ = ("text",)
+
     def __init__(self, text: str = ""):
         self.text = text
 
-    def generate(self, item: Any, index: int, previous_result: str) -> str:
+    def generate(self, info: ClipInfo, index: int, previous_result: str) -> str:
         """Return custom text."""
         return self.text
 
 
 class ColumnDataComponent(Component):
-
     """Clip property data component."""
 
+    __slots__ = ("column",)
+
     def __init__(self, column: str = "Name"):
         self.column = column
 
-    def generate(self, item: Any, index: int, previous_result: str) -> str:
+    def generate(self, info: ClipInfo, index: int, previous_result: str) -> str:
         """Get data from clip property."""
-        try:
-            if self.column == "Name":
-                return item.GetName()
-            elif self.column == "Clip Color":
-                color = item.GetClipProperty("Clip Color")
-                return color if color else ""
-            else:
-                # Try metadata
-                metadata = item.GetMetadata()
-                value = metadata.get(self.column, "")
-                return value if value else ""
-        except Exception:
-            return ""
+        column = self.column
+        if column == "Name":
+            return info.name
+        elif column == "Clip Color":
+            return info.clip_color
+        # Try metadata
+        return str(info.metadata.get(column) or "")
+
+
+# Component constructors by config "type"
+_COMPONENT_FACTORIES: dict[str, Callable[[dict[str, Any]], Component]] = {
+    "Counter": lambda config: CounterComponent(
+        start=config.get("start", 1),
+        padding=config.get("padding", 3),
+        increment=config.get("increment", 1)
+    ),
+    "Specified Text": lambda config: SpecifiedTextComponent(
+        text=config.get("text", "")
+    ),
+    "Column Data": lambda config: ColumnDataComponent(
+        column=config.get("column", "Name")
+    ),
+}
 
 
 class BatchRenamer:
@@ -134,8 +245,13 @@ class BatchRenamer:
         self.media_pool = None
         self.selected_items: list[Any] = []
         self.components: list[Component] = []
+        # Bound generate() methods of self.components, resolved once in set_components
+        self._generators: list[Callable[[ClipInfo, int, str], str]] = []
+        # Name by index when no component reads clip data (see _build_fast_name)
+        self._fast_name: Callable[[int], str] | None = None
         self.metadata_properties: list[str] = []
-        self._clip_name_cache: list[str] = []  # Cache clip names by index for performance
+        # Cached clip data by selection index, rebuilt by set_selection()
+        self._clip_infos: list[ClipInfo] = []
 
     def initialize(self) -> bool:
         """Initialize Resolve objects and get selected items."""
@@ -166,26 +282,24 @@ class BatchRenamer:
 
         # Get selected items
         try:
-            self.selected_items = self.media_pool.GetSelectedClips()
+            selected_items = self.media_pool.GetSelectedClips()
 
-            if not self.selected_items:
+            if not selected_items:
                 print("WARNING: No clips selected in Media Pool")
                 print("         Please select clips in the Media Pool and try again")
                 return False
 
+            self.set_selection(selected_items)
             print(f"Found {len(self.selected_items)} selected item(s)")
 
-            # Cache original clip names once (avoids repeated API calls)
-            self._clip_name_cache = [item.GetName() for item in self.selected_items]
-
         except Exception as e:
             print(f"ERROR: Failed to get selected clips: {e}")
             return False
 
         # Get metadata properties from first item
         try:
-            first_item = self.selected_items[0]
-            metadata = first_item.GetMetadata()
+            # Goes through the cache, so previews reuse the first clip's metadata
+            metadata = self._clip_infos[0].metadata
             if metadata:
                 self.metadata_properties = list(metadata.keys())
         except Exception:
@@ -193,6 +307,18 @@ class BatchRenamer:
 
         return True
 
+    def set_selection(self, items: list[Any]) -> None:
+        """
+        Set the selected items and rebuild the cached clip data.
+
+        Args:
+            items: Media pool items to rename
+        """
+        self.selected_items = items
+        # Cache original clip names once (avoids repeated API calls);
+        # metadata and clip color are fetched on first use
+        self._clip_infos = [ClipInfo(item, item.GetName()) for item in items]
+
     def set_components(self, component_configs: list[dict[str, Any]]) -> None:
         """
         Set components from configuration list.
@@ -200,43 +326,91 @@ class BatchRenamer:
         Args:
             component_configs: List of component configurations
         """
-        self.components = []
-        for config in component_configs:
-            comp_type = config.get("type", "")
+        # Unknown types are skipped
+        self.components = [
+            factory(config)
+            for config in component_configs
+            if (factory := _COMPONENT_FACTORIES.get(config.get("type", ""))) is not None
+        ]
 
-            if comp_type == "Counter":
-                self.components.append(CounterComponent(
-                    start=config.get("start", 1),
-                    padding=config.get("padding", 3),
-                    increment=config.get("increment", 1)
-                ))
-            elif comp_type == "Specified Text":
-                self.components.append(SpecifiedTextComponent(
-                    text=config.get("text", "")
-                ))
-            elif comp_type == "Column Data":
-                self.components.append(ColumnDataComponent(
-                    column=config.get("column", "Name")
-                ))
+        self._fast_name = self._build_fast_name(self.components)
+        if self._fast_name is not None:
+            self._generators = []
+            return
+
+        # Counters format every value for the pass up front, the name loop just indexes
+        count = len(self._clip_infos)
+        self._generators = [
+            component.precomputed(count) if type(component) is CounterComponent else component.generate
+            for component in self.components
+        ]
 
-    def generate_new_name(self, item: Any, index: int) -> str:
+    @staticmethod
+    def _build_fast_name(components: list[Component]) -> Callable[[int], str] | None:
+        """
+        Build a name-by-index function for components that never read clip data.
+
+        Only Counter and Specified Text qualify: the texts are folded into a single
+        format template with one field per counter, so each clip costs one format
+        call instead of one call per component.
+
+        Args:
+            components: Components in name order
+
+        Returns:
+            Function mapping a selection index to the generated name, or None if
+            a component needs the clip (Column Data or a custom component)
+        """
+        if not components:
+            return None
+
+        template_parts: list[str] = []
+        counters: list[tuple[int, int]] = []
+        for component in components:
+            component_type = type(component)
+            if component_type is SpecifiedTextComponent:
+                template_parts.append(component.text.replace("{", "{{").replace("}", "}}"))
+            elif component_type is CounterComponent:
+                template_parts.append(f"{{:0{component.padding}d}}")
+                counters.append((component.start, component.increment))
+            else:
+                return None
+
+        template = "".join(template_parts)
+        if not counters:
+            # Same name for every clip ("{{" escapes undone by a plain format)
+            const_name = template.format()
+            return lambda index: const_name
+
+        fmt = template.format
+        return lambda index: fmt(*[start + index * increment for start, increment in counters])
+
+    def generate_new_name(self, info: ClipInfo, index: int) -> str:
         """
         Generate new name by applying all components in sequence.
 
         Args:
-            item: Media pool item
+            info: Cached data of the media pool item
             index: Index in selection
 
         Returns:
             Generated name
         """
-        result = ""
+        if self._fast_name is not None:
+            result = self._fast_name(index)
+            return result if result else info.name
+
+        # Collect parts and join once (repeated += copies the growing name each time)
+        parts: list[str] = []
 
-        for component in self.components:
-            component_output = component.generate(item, index, result)
-            result += component_output
+        append = parts.append
+        previous = ""
+        for generate in self._generators:
+            previous = generate(info, index, previous)
+            append(previous)
 
-        return result if result else item.GetName()
+        result = "".join(parts)
+        return result if result else info.name
 
     def preview_changes(self, component_configs: list[dict[str, Any]]) -> list[tuple[str, str]]:
         """
@@ -251,15 +425,14 @@ class BatchRenamer:
         self.set_components(component_configs)
         preview_list: list[tuple[str, str]] = []
 
-        for idx, item in enumerate(self.selected_items):
-            # Use cached name (avoids repeated API call)
-            original_name = self._clip_name_cache[idx] if idx < len(self._clip_name_cache) else item.GetName()
-            new_name = self.generate_new_name(item, idx)
-            preview_list.append((original_name, new_name))
+        for idx, info in enumerate(self._clip_infos):
+            new_name = self.generate_new_name(info, idx)
+            preview_list.append((info.name, new_name))
 
         return preview_list
 
-    def apply_batch_rename(self, component_configs: list[dict[str, Any]], verbose: bool = False) -> tuple[bool, str]:
+    def apply_batch_rename(self, component_configs: list[dict[str, Any]],
+                           verbose: bool = False) -> tuple[bool, str, list[tuple[str, str]]]:
         """
         Apply batch rename with current component configuration.
 
@@ -268,25 +441,27 @@ class BatchRenamer:
             verbose: If True, print each rename operation (default: False)
 
         Returns:
-            Tuple of (success: bool, message: str)
+            Tuple of (success: bool, message: str, renamed: list of
+            (original_name, new_name) tuples for the clips actually renamed)
         """
+        renamed: list[tuple[str, str]] = []
         try:
             if not self.selected_items:
-                return False, "No items selected"
+                return False, "No items selected", renamed
 
             if not component_configs:
-                return False, "No components configured"
+                return False, "No components configured", renamed
 
             self.set_components(component_configs)
 
             success_count = 0
             error_count = 0
 
-            for idx, item in enumerate(self.selected_items):
+            for idx, info in enumerate(self._clip_infos):
+                item = info.item
                 try:
-                    # Use cached name (avoids repeated API call)
-                    original_name = self._clip_name_cache[idx] if idx < len(self._clip_name_cache) else item.GetName()
-                    new_name = self.generate_new_name(item, idx)
+                    original_name = info.name
+                    new_name = self.generate_new_name(info, idx)
 
                     # Skip if name hasn't changed
                     if new_name == original_name:
@@ -297,8 +472,8 @@ class BatchRenamer:
                     if result:
                         success_count += 1
                         # Update cache with new name for consistency
-                        if idx < len(self._clip_name_cache):
-                            self._clip_name_cache[idx] = new_name
+                        info.set_name(new_name)
+                        renamed.append((original_name, new_name))
                         if verbose:
                             print(f"✓ Renamed: '{original_name}' → '{new_name}'")
                     else:
@@ -316,18 +491,19 @@ class BatchRenamer:
                 message = f"✓ Renamed {success_count} item(s)"
                 if error_count > 0:
                     message += f", {error_count} error(s)"
-                return True, message
+                return True, message, renamed
             else:
-                return False, f"No items renamed. {error_count} error(s) occurred"
+                return False, f"No items renamed. {error_count} error(s) occurred", renamed
 
         except Exception as e:
-            return False, f"Error: {e}"
+            return False, f"Error: {e}", renamed
 
 
 class BatchEditDialog:
     """Manages the batch edit dialog UI."""
 
     MAX_COMPONENTS = 10  # Maximum number of component rows
+    PREVIEW_DELAY_MS = 80  # Quiet period before a UI change refreshes the preview
 
     # Component type constants
     COMPONENT_TYPES = ["Counter", "Specified Text", "Column Data"]
@@ -346,6 +522,16 @@ class BatchEditDialog:
         self.ui = None
         self.disp = None
         self.window = None
+        self._preview_timer = None
+        # Rows are added on demand by the Add Component button
+        self._row_count = 0
+        # Window items and per-row widget handles, looked up once (see _cache_row)
+        self._itm: dict[str, Any] | None = None
+        self._rows: list[dict[str, Any]] = []
+        # Component configuration of the text currently in PreviewText
+        self._last_configs_key: tuple | None = None
+        # Cleared while applying and once the dialog closes (preview would be thrown away)
+        self._previews_enabled = True
 
     def _build_component_row(self, i: int) -> list[Any]:
         """
@@ -359,7 +545,7 @@ class BatchEditDialog:
         """
         return [
             self.ui.HGroup([
-                self.ui.CheckBox({"ID": f"EnableComponent_{i}", "Text": "", "Checked": (i == 0), "Weight": 0, "MinimumSize": [25, 0]}),
+                self.ui.CheckBox({"ID": f"EnableComponent_{i}", "Text": "", "Checked": True, "Weight": 0, "MinimumSize": [25, 0]}),
                 self.ui.HGap(5),
                 self.ui.ComboBox({"ID": f"ComponentType_{i}", "Weight": 0, "MinimumSize": [150, 0]}),
                 self.ui.HGap(8),
@@ -392,6 +578,30 @@ class BatchEditDialog:
             self.ui.VGap(20),
         ]
 
+    def _build_components_section(self) -> list[Any]:
+        """
+        Build UI elements for the component rows and the Add Component button.
+
+        Only the first row is created here; on_add_component() appends the rest.
+
+        Returns:
+            List of UI elements for the components
+        """
+        self._row_count = 1
+        return [
+            self.ui.VGroup({"ID": "ComponentRows", "Weight": 0}, self._build_component_row(0)),
+            self.ui.HGroup({"Weight": 0}, [
+                self.ui.Button({
+                    "ID": "AddComponentButton",
+                    "Text": "+ Add Component",
+                    "MinimumSize": [130, 28],
+                    "Weight": 0,
+                }),
+                self.ui.HGap(0, 1),
+            ]),
+            self.ui.VGap(20),
+        ]
+
     def _build_header_section(self, item_count: int) -> list[Any]:
         """
         Build UI elements for the header section.
@@ -481,8 +691,6 @@ class BatchEditDialog:
     def create_dialog(self) -> bool:
         """Create and show the batch edit dialog."""
         try:
-            import DaVinciResolveScript
-
             # Get Fusion and UIManager
             self.fusion = self.resolve.Fusion()
             if not self.fusion:
@@ -495,16 +703,11 @@ class BatchEditDialog:
                 return False
 
             # Create UIDispatcher instance
-            self.disp = DaVinciResolveScript.UIDispatcher(self.ui)
+            self.disp = _get_dvr().UIDispatcher(self.ui)
 
             # Get item count
             item_count = len(self.renamer.selected_items)
 
-            # Build all component rows using helper method
-            component_rows = []
-            for i in range(self.MAX_COMPONENTS):
-                component_rows.extend(self._build_component_row(i))
-
             # Create dialog window using helper methods for UI sections
             self.window = self.disp.AddWindow({
                 "WindowTitle": "Batch Edit - Build Name from Components",
@@ -513,28 +716,43 @@ class BatchEditDialog:
             }, [
                 self.ui.VGroup(
                     self._build_header_section(item_count) +
-                    component_rows +
+                    self._build_components_section() +
                     self._build_preview_section() +
                     self._build_button_section()
                 ),
             ])
+            self._itm = self.window.GetItems()
+            self._rows = [self._cache_row(i) for i in range(self._row_count)]
 
             # Set up event handlers
             self.window.On.BatchEditDialog.Close = lambda ev: self.on_close(ev)
             self.window.On.CloseButton.Clicked = lambda ev: self.on_close(ev)
             self.window.On.PreviewButton.Clicked = lambda ev: self.on_preview(ev)
             self.window.On.ApplyButton.Clicked = lambda ev: self.on_apply(ev)
+            self.window.On.AddComponentButton.Clicked = lambda ev: self.on_add_component(ev)
+
+            # Single-shot timer that coalesces bursts of UI changes into one preview.
+            # It fires on the UI thread, so the preview can touch widgets directly.
+            try:
+                self._preview_timer = self.ui.Timer({
+                    "ID": "PreviewTimer",
+                    "Interval": self.PREVIEW_DELAY_MS,
+                    "SingleShot": True,
+                })
+                self.disp.On.Timeout = lambda ev: self.update_preview()
+            except Exception as e:
+                print(f"WARNING: Preview timer unavailable, previews will update immediately: {e}")
+                self._preview_timer = None
 
             # Set up event handlers for all components
-            for i in range(self.MAX_COMPONENTS):
-                self.window.On[f"ComponentType_{i}"].CurrentIndexChanged = lambda ev, idx=i: self.on_component_type_changed(ev, idx)
-                self.window.On[f"EnableComponent_{i}"].Clicked = lambda ev: self.update_preview()
+            for i in range(self._row_count):
+                self._register_row_events(i)
 
             # Initialize row widgets with dropdown options
             self.initialize_row_widgets()
 
             # Initialize UI state for all rows to ensure proper visibility
-            for i in range(self.MAX_COMPONENTS):
+            for i in range(self._row_count):
                 self.update_component_ui(i)
 
             # Show initial preview
@@ -543,6 +761,8 @@ class BatchEditDialog:
             # Show window
             self.window.Show()
             self.disp.RunLoop()
+            if self._preview_timer:
+                self._preview_timer.Stop()
             self.window.Hide()
 
             return True
@@ -553,95 +773,176 @@ class BatchEditDialog:
             traceback.print_exc()
             return False
 
+    def _register_row_events(self, i: int) -> None:
+        """Connect the event handlers of component row i."""
+        self.window.On[f"ComponentType_{i}"].CurrentIndexChanged = lambda ev, idx=i: self.on_component_type_changed(ev, idx)
+        self.window.On[f"EnableComponent_{i}"].Clicked = lambda ev: self._schedule_preview()
+
+    def _cache_row(self, i: int) -> dict[str, Any]:
+        """
+        Look up the widgets of component row i once.
+
+        Args:
+            i: Component row index
+
+        Returns:
+            Widget handles of the row keyed by role
+        """
+        itm = self._itm
+        return {
+            "enable": itm[f"EnableComponent_{i}"],
+            "type": itm[f"ComponentType_{i}"],
+            "stack": itm[f"ComponentStack_{i}"],
+            "start": itm[f"CounterStart_{i}"],
+            "padding": itm[f"CounterPadding_{i}"],
+            "increment": itm[f"CounterIncrement_{i}"],
+            "text": itm[f"SpecifiedText_{i}"],
+            "column": itm[f"ColumnData_{i}"],
+        }
+
+    def _initialize_row(self, row: dict[str, Any], available_columns: list[str]) -> None:
+        """Fill the dropdowns of a component row."""
+        # Initialize Component Type dropdown
+        type_combo = row["type"]
+        type_combo.AddItems(self.COMPONENT_TYPES)
+        type_combo.CurrentIndex = 0
+
+        # Initialize Column Data dropdown
+        column_combo = row["column"]
+        column_combo.AddItems(available_columns)
+        if available_columns:
+            column_combo.CurrentIndex = 0
+
     def initialize_row_widgets(self) -> None:
         """Initialize row widgets with options after window is created."""
-        itm = self.window.GetItems()
         available_columns = ["Name", "Clip Color"] + self.renamer.metadata_properties
 
-        for i in range(self.MAX_COMPONENTS):
-            # Initialize Component Type dropdown
-            type_combo = itm[f"ComponentType_{i}"]
-            type_combo.AddItems(self.COMPONENT_TYPES)
-            type_combo.CurrentIndex = 0
+        for row in self._rows:
+            self._initialize_row(row, available_columns)
+
+    def on_add_component(self, ev: Any) -> None:
+        """Handle Add Component button click: append one more component row."""
+        try:
+            if self._row_count >= self.MAX_COMPONENTS:
+                return
+
+            i = self._row_count
+            rows = self._itm["ComponentRows"]
+            for widget in self._build_component_row(i):
+                rows.AddChild(widget)
+            self._row_count += 1
 
-            # Initialize Column Data dropdown
-            column_combo = itm[f"ColumnData_{i}"]
-            column_combo.AddItems(available_columns)
-            if available_columns:
-                column_combo.CurrentIndex = 0
+            # Look the items up again so the new row's widgets are included
+            self._itm = self.window.GetItems()
+            self._rows.append(self._cache_row(i))
+            self._register_row_events(i)
+            self._initialize_row(self._rows[i], ["Name", "Clip Color"] + self.renamer.metadata_properties)
+            self.update_component_ui(i)
+
+            if self._row_count >= self.MAX_COMPONENTS:
+                self._itm["AddComponentButton"].Enabled = False
+
+            self.window.RecalcLayout()
+
+            # The new row starts enabled, so it takes part in the preview right away
+            self._schedule_preview()
+
+        except Exception as e:
+            print(f"ERROR in on_add_component: {e}")
+            import traceback
+            traceback.print_exc()
 
     def on_component_type_changed(self, ev: Any, row_index: int) -> None:
         """Handle component type dropdown change."""
         self.update_component_ui(row_index)
-        self.update_preview()
+        self._schedule_preview()
+
+    def _schedule_preview(self) -> None:
+        """Refresh the preview once UI changes settle (restarts the pending timer)."""
+        if self._preview_timer:
+            self._preview_timer.Start()
+        else:
+            self.update_preview()
 
     def update_component_ui(self, row_index: int) -> None:
         """Update UI visibility based on component type using Stack widget."""
-        itm = self.window.GetItems()
-        comp_type = itm[f"ComponentType_{row_index}"].CurrentText
+        row = self._rows[row_index]
+        comp_type = row["type"].CurrentText
 
         # Get the Stack widget for this row and set its index
-        stack = itm[f"ComponentStack_{row_index}"]
+        stack = row["stack"]
         stack.CurrentIndex = self.COMPONENT_STACK_INDEX.get(comp_type, 0)
 
     def get_component_configs(self) -> list[dict[str, Any]]:
         """Get component configurations from enabled rows only."""
-        itm = self.window.GetItems()
         configs = []
 
-        for i in range(self.MAX_COMPONENTS):
+        for row in self._rows:
             # Skip if checkbox is not checked
-            if not itm[f"EnableComponent_{i}"].Checked:
+            if not row["enable"].Checked:
                 continue
 
-            comp_type = itm[f"ComponentType_{i}"].CurrentText
+            comp_type = row["type"].CurrentText
 
             # Add component based on type
             if comp_type == "Counter":
                 configs.append({
                     "type": "Counter",
-                    "start": itm[f"CounterStart_{i}"].Value,
-                    "padding": itm[f"CounterPadding_{i}"].Value,
-                    "increment": itm[f"CounterIncrement_{i}"].Value,
+                    "start": row["start"].Value,
+                    "padding": row["padding"].Value,
+                    "increment": row["increment"].Value,
                 })
             elif comp_type == "Specified Text":
                 # Add specified text (even if empty, user might want empty string)
                 configs.append({
                     "type": "Specified Text",
-                    "text": itm[f"SpecifiedText_{i}"].Text,
+                    "text": row["text"].Text,
                 })
             elif comp_type == "Column Data":
                 configs.append({
                     "type": "Column Data",
-                    "column": itm[f"ColumnData_{i}"].CurrentText,
+                    "column": row["column"].CurrentText,
                 })
 
         return configs
 
+    @staticmethod
+    def _format_name_pairs(name_pairs: list[tuple[str, str]]) -> str:
+        """Format (original, new) name pairs as aligned preview lines."""
+        # Names padded to the widest original name
+        max_original_len = max(map(len, [original for original, _ in name_pairs]), default=0)
+        return "\n".join([
+            f"{original:{max_original_len}} → {new_name}"
+            for original, new_name in name_pairs
+        ])
+
     def update_preview(self) -> None:
         """Update the preview text area."""
+        if not self._previews_enabled:
+            return
+
         try:
-            itm = self.window.GetItems()
+            itm = self._itm
             configs = self.get_component_configs()
 
             if not configs:
+                self._last_configs_key = None
                 itm["PreviewText"].PlainText = "No components configured"
                 return
 
+            # Same components over the same clips - the preview already shows this
+            configs_key = tuple(tuple(sorted(config.items())) for config in configs)
+            if configs_key == self._last_configs_key:
+                return
+
             # Get preview list
             preview_list = self.renamer.preview_changes(configs)
 
-            # Build preview text
-            preview_lines = []
-            max_original_len = max((len(original) for original, _ in preview_list), default=0)
-
-            for original, new_name in preview_list:
-                preview_lines.append(f"{original:{max_original_len}} → {new_name}")
-
-            preview_text = "\n".join(preview_lines)
-            itm["PreviewText"].PlainText = preview_text
+            itm["PreviewText"].PlainText = self._format_name_pairs(preview_list)
+            self._last_configs_key = configs_key
 
         except Exception as e:
+            self._last_configs_key = None
             print(f"ERROR in update_preview: {e}")
             import traceback
             traceback.print_exc()
@@ -649,9 +950,16 @@ class BatchEditDialog:
     def on_preview(self, ev: Any) -> None:
         """Handle Preview button click."""
         try:
+            # An explicit preview always rebuilds from a fresh read of the selection,
+            # so names and metadata edited in Resolve since the last read show up
+            # (get_selection() also forgets the memoized component configs)
+            if not self.get_selection():
+                # Error message already set by get_selection()
+                return
+
             self.update_preview()
 
-            itm = self.window.GetItems()
+            itm = self._itm
             itm["StatusLabel"].Text = "✓ Preview updated"
             itm["StatusLabel"].StyleSheet = "QLabel { color: green; }"
 
@@ -671,16 +979,16 @@ class BatchEditDialog:
 
             if not current_selection:
                 # Update status to show no clips selected
-                itm = self.window.GetItems()
+                itm = self._itm
                 itm["StatusLabel"].Text = "ERROR: No clips currently selected in Media Pool"
                 itm["StatusLabel"].StyleSheet = "QLabel { color: red; }"
                 return False
 
-            # Update renamer's selection
-            self.renamer.selected_items = current_selection
+            # Update renamer's selection and its cached clip data
+            self.renamer.set_selection(current_selection)
 
-            # Update clip name cache
-            self.renamer._clip_name_cache = [item.GetName() for item in current_selection]
+            # Clips (or their names) may differ from what the preview was built on
+            self._last_configs_key = None
 
             return True
 
@@ -698,7 +1006,7 @@ class BatchEditDialog:
                 # Error message already set by get_selection()
                 return
 
-            itm = self.window.GetItems()
+            itm = self._itm
             configs = self.get_component_configs()
 
             if not configs:
@@ -706,15 +1014,21 @@ class BatchEditDialog:
                 itm["StatusLabel"].StyleSheet = "QLabel { color: red; }"
                 return
 
-            # Apply batch rename
-            success, message = self.renamer.apply_batch_rename(configs)
+            # Apply batch rename (a preview firing meanwhile would only be overwritten)
+            self._previews_enabled = False
+            try:
+                success, message, renamed = self.renamer.apply_batch_rename(configs)
+            finally:
+                self._previews_enabled = True
 
             # Update status
             if success:
                 itm["StatusLabel"].Text = message
                 itm["StatusLabel"].StyleSheet = "QLabel { color: green; }"
-                # Update preview to show applied changes
-                self.update_preview()
+                # Show the applied changes (already computed by the rename pass);
+                # the next preview rebuilds from the renamed clips
+                itm["PreviewText"].PlainText = self._format_name_pairs(renamed)
+                self._last_configs_key = None
             else:
                 itm["StatusLabel"].Text = message
                 itm["StatusLabel"].StyleSheet = "QLabel { color: red; }"
@@ -726,6 +1040,7 @@ class BatchEditDialog:
 
     def on_close(self, ev: Any) -> None:
         """Handle window close."""
+        self._previews_enabled = False
         self.disp.ExitLoop()
 
 
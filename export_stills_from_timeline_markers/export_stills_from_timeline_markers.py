@@ -12,8 +12,7 @@ from typing import Any
 import sys
 import os
 import glob
-import traceback
-from timecode import Timecode
+import threading
 
 
 def add_resolve_module_path() -> bool:
@@ -78,6 +77,64 @@ def get_resolve() -> Any | None:
         return None
 
 
+# timecode.Timecode, imported on first use (only drop-frame timelines need it)
+_Timecode: Any | None = None
+
+
+def _timecode_class() -> Any:
+    """Get the timecode module's Timecode class, importing it on first use."""
+    global _Timecode
+    if _Timecode is None:
+        from timecode import Timecode
+        _Timecode = Timecode
+    return _Timecode
+
+
+def _is_drop_frame_rate(frame_rate: float) -> bool:
+    """
+    Check if a frame rate uses drop-frame timecode (29.97, 59.94, 119.88).
+
+    Matches the timecode module: NTSC rates that are multiples of 30000/1001.
+    """
+    fps_int = round(frame_rate)
+    return fps_int % 30 == 0 and abs(frame_rate - fps_int * 1000 / 1001) < 0.01
+
+
+def _frames_to_hmsf(total_frames: int, fps_int: int) -> tuple[int, int, int, int]:
+    """
+    Split a non-drop-frame frame count into timecode fields.
+
+    Args:
+        total_frames: Frames since 00:00:00:00
+        fps_int: Integer (nominal) frame rate
+
+    Returns:
+        Tuple of (hours, minutes, seconds, frames); hours wrap at 24 like the timecode module
+    """
+    seconds, frames = divmod(total_frames, fps_int)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return hours % 24, minutes, seconds, frames
+
+
+def _timecode_to_frames(tc_str: str, fps_int: int) -> int | None:
+    """
+    Parse a non-drop-frame "HH:MM:SS:FF" timecode into a frame count.
+
+    Args:
+        tc_str: Timecode string
+        fps_int: Integer (nominal) frame rate
+
+    Returns:
+        Frames since 00:00:00:00, or None if the string is not a plain timecode
+    """
+    try:
+        hours, minutes, seconds, frames = (int(part) for part in tc_str.split(":"))
+    except (AttributeError, ValueError):
+        return None
+    return ((hours * 60 + minutes) * 60 + seconds) * fps_int + frames
+
+
 class MarkerStillExporter:
     """
     Exports still frames from timeline markers to a temporary Gallery album.
@@ -91,6 +148,12 @@ class MarkerStillExporter:
         "DPX": ("dpx", "dpx"),
     }
 
+    # Media Pool item Type values that denote timelines
+    _TIMELINE_TYPES: frozenset[str] = frozenset({"Timeline", "Compound Clip", "Compound"})
+
+    # Stills per DeleteStills call; very large lists may be truncated by Resolve
+    DELETE_CHUNK_SIZE = 512
+
     # Default album name for temporary captures
     DEFAULT_ALBUM_NAME = "TempMarkerStills"
 
@@ -114,8 +177,21 @@ class MarkerStillExporter:
         self.media_pool = self.project.GetMediaPool()
         self.gallery = self.project.GetGallery()
         self.temp_album = None
-        self.created_stills = []  # Track stills created by this script
-        self._timeline_cache: dict[str, dict[str, Any]] = {}  # Cache timeline properties for performance
+        # (still, filename) for every still created by this script, until cleanup
+        self._captured: list[tuple[Any, str]] = []
+        self._rename_thread: threading.Thread | None = None  # Background file renames (see export_stills)
+        # Project timelines by key getter ("GetUniqueId"/"GetName"): [key-to-timeline map,
+        # next project timeline index to scan (1-based)], filled incrementally by _find_timelines
+        self._timeline_scans: dict[str, list[Any]] = {}
+        self._timeline_scans_count = -1  # GetTimelineCount() the scans were built against (-1: none)
+        # Whether Media Pool item IDs match Timeline IDs (None until first seen)
+        self._match_timelines_by_id: bool | None = None
+        self._timeline_cache: dict[int, dict[str, Any]] = {}  # Cache timeline properties by id() for performance
+
+    @property
+    def created_stills(self) -> list[Any]:
+        """Stills created by this script that have not been cleaned up yet."""
+        return [still for still, _ in self._captured]
 
     def _get_timeline_properties(self, timeline: Any) -> dict[str, Any]:
         """
@@ -128,32 +204,37 @@ class MarkerStillExporter:
             Dictionary containing cached timeline properties:
                 - 'frame_rate': Timeline frame rate as float
                 - 'start_tc': Timeline start timecode string
-                - 'start_frame': Timeline start frame
-                - 'timecode_base': Base Timecode object for conversions
+                - 'fps_int': Integer (nominal) frame rate
+                - 'start_frames': Start timecode as a frame count, or None when
+                  conversions must go through the timecode module (drop-frame)
         """
-        timeline_name = timeline.GetName()
-
-        # Return cached properties if available
-        if timeline_name in self._timeline_cache:
-            return self._timeline_cache[timeline_name]
+        # Keyed by object identity: no API call needed to find the cached entry
+        cached = self._timeline_cache.get(id(timeline))
+        if cached is not None:
+            return cached
 
         # Fetch and cache timeline properties
         frame_rate = float(timeline.GetSetting("timelineFrameRate"))
         start_tc = timeline.GetStartTimecode()
-        start_frame = timeline.GetStartFrame()
 
-        # Create base Timecode object for this timeline
-        timecode_base = Timecode(frame_rate, start_timecode=start_tc)
+        # Non-drop-frame rates convert with plain integer math (see frame_to_timecode),
+        # only drop-frame rates go through the timecode module
+        fps_int = int(round(frame_rate))
+        if _is_drop_frame_rate(frame_rate):
+            start_frames = None
+        else:
+            start_frames = _timecode_to_frames(start_tc, fps_int)
 
-        # Cache all properties
-        self._timeline_cache[timeline_name] = {
+        # Cache all properties (the entry keeps the timeline alive so its id() is not reused)
+        cached = self._timeline_cache[id(timeline)] = {
+            'timeline': timeline,
             'frame_rate': frame_rate,
             'start_tc': start_tc,
-            'start_frame': start_frame,
-            'timecode_base': timecode_base,
+            'fps_int': fps_int,
+            'start_frames': start_frames,
         }
 
-        return self._timeline_cache[timeline_name]
+        return cached
 
     def get_selected_timelines(self) -> list[Any]:
         """
@@ -169,40 +250,104 @@ class MarkerStillExporter:
             print("ERROR: No items selected in Media Pool")
             return []
 
-        # Get timeline names from selected MediaPoolItems
-        timeline_names: list[str] = []
+        # Get timeline items from selected MediaPoolItems
+        timeline_items: list[Any] = []
 
+        timeline_types = self._TIMELINE_TYPES
         for item in selected_items:
             try:
-                # Check if item is a timeline by looking at its properties
-                props = item.GetClipProperty()
-                if props:
-                    # Check if Type indicates it's a timeline
-                    item_type = props.get("Type", "")
-                    if "Timeline" in str(item_type) or "Compound" in str(item_type):
-                        timeline_names.append(item.GetName())
+                # Fetch only the Type property instead of the full property dict
+                item_type = item.GetClipProperty("Type")
             except Exception:
                 continue
 
-        if not timeline_names:
+            # Some Resolve versions return {"Type": value}
+            if isinstance(item_type, dict):
+                item_type = item_type.get("Type", "")
+            item_type = str(item_type or "").strip()
+
+            # Check if Type indicates it's a timeline (substring check only for unknown variants)
+            if item_type in timeline_types or "Timeline" in item_type or "Compound" in item_type:
+                timeline_items.append(item)
+
+        if not timeline_items:
             print("ERROR: No timeline items found in selection")
             print("Please select timeline items (not clips) from the Media Pool")
             return []
 
-        # Get actual Timeline objects from project by matching names
-        # Build timeline name-to-object map once (O(n) instead of O(n*m))
+        # Get actual Timeline objects from project, matching unique IDs first
+        # (unambiguous with duplicate timeline names)
+        timelines: list[Any | None] = [None] * len(timeline_items)
+        if self._match_timelines_by_id is not False:
+            unique_ids = [self._get_unique_id(item) for item in timeline_items]
+            wanted_ids = {unique_id for unique_id in unique_ids if unique_id}
+            if wanted_ids:
+                id_map = self._find_timelines(wanted_ids, "GetUniqueId")
+                timelines = [id_map.get(unique_id) if unique_id else None for unique_id in unique_ids]
+                if any(timelines):
+                    self._match_timelines_by_id = True
+                elif self._match_timelines_by_id is None:
+                    # IDs don't correspond in this Resolve version - use names from now on
+                    self._match_timelines_by_id = False
+
+        # Fall back to matching names for anything the IDs didn't resolve
+        missing = [idx for idx, timeline in enumerate(timelines) if timeline is None]
+        if missing:
+            names = [timeline_items[idx].GetName() for idx in missing]
+            name_map = self._find_timelines(set(names), "GetName")
+            for idx, name in zip(missing, names):
+                timelines[idx] = name_map.get(name)
+
+        return [timeline for timeline in timelines if timeline is not None]
+
+    @staticmethod
+    def _get_unique_id(item: Any) -> str:
+        """Get a Media Pool item's unique ID ("" if unavailable)."""
+        try:
+            return item.GetUniqueId() or ""
+        except Exception:
+            return ""
+
+    def _find_timelines(self, keys: set[str], key_getter: str) -> dict[str, Any]:
+        """
+        Map timeline keys to project Timeline objects, scanning only as far as needed.
+
+        The scan stops as soon as every requested key is found, and its progress is
+        kept for later calls while the project's timeline count is unchanged.
+
+        Args:
+            keys: Timeline keys to find
+            key_getter: Timeline method returning the key ("GetUniqueId" or "GetName")
+
+        Returns:
+            Key-to-timeline map covering every project timeline scanned so far
+        """
         timeline_count = self.project.GetTimelineCount()
-        timeline_map: dict[str, Any] = {}
+        reused = timeline_count == self._timeline_scans_count
+        if not reused:
+            self._timeline_scans = {}
+            self._timeline_scans_count = timeline_count
 
-        for idx in range(1, timeline_count + 1):  # 1-based!
+        scan = self._timeline_scans.setdefault(key_getter, [{}, 1])
+        timeline_map, idx = scan
+        needed = keys - timeline_map.keys()
+
+        while needed and idx <= timeline_count:  # 1-based!
             timeline = self.project.GetTimelineByIndex(idx)
+            idx += 1
             if timeline:
-                timeline_map[timeline.GetName()] = timeline
+                key = getattr(timeline, key_getter)()
+                if key not in timeline_map:
+                    timeline_map[key] = timeline
+                needed.discard(key)
+        scan[1] = idx
 
-        # Lookup timelines by name
-        timelines = [timeline_map[name] for name in timeline_names if name in timeline_map]
+        if needed and reused:
+            # Keys missing from a reused map: timelines may have been renamed - rescan once
+            self._timeline_scans_count = -1  # never a real count, so the retry rescans exactly once
+            return self._find_timelines(keys, key_getter)
 
-        return timelines
+        return timeline_map
 
     def scan_markers(self, timelines: list[Any], color_filter: str | None = None) -> list[tuple[Any, list[tuple[int, dict]]]]:
         """
@@ -237,14 +382,20 @@ class MarkerStillExporter:
             if marker_list:
                 timeline_markers.append((timeline, marker_list))
 
+        # Visit the timeline with the most markers first so the viewer warm-up after
+        # SetCurrentTimeline is paid where most grabs follow. Within a timeline markers
+        # are already in frame order, so every seek moves forward by the shortest step.
+        timeline_markers.sort(key=lambda entry: len(entry[1]), reverse=True)
+
         return timeline_markers
 
     def create_temp_album(self, album_name: str | None = None) -> Any | None:
         """
-        Get the first Gallery still album for capturing stills.
+        Get the Gallery still album for capturing stills.
 
-        Note: This method doesn't actually create a new album, it uses the first
-        existing album and sets its label.
+        Note: This method doesn't actually create a new album, it uses the current
+        album (where GrabStill() puts stills), or the first album if none is current,
+        and sets its label.
 
         Args:
             album_name: Label to set on the album (defaults to DEFAULT_ALBUM_NAME)
@@ -255,26 +406,29 @@ class MarkerStillExporter:
         if album_name is None:
             album_name = self.DEFAULT_ALBUM_NAME
 
-        # Get first available album
-        albums = self.gallery.GetGalleryStillAlbums()
-        if not albums:
-            print("ERROR: Could not access Gallery albums")
-            return None
-
-        self.temp_album = albums[0]
+        # Grabbed stills land in the current album, so label, export and delete there
+        album = self.gallery.GetCurrentStillAlbum()
+        if not album:
+            # Get first available album
+            albums = self.gallery.GetGalleryStillAlbums()
+            if not albums:
+                print("ERROR: Could not access Gallery albums")
+                return None
+            album = albums[0]
+
+        self.temp_album = album
         self.temp_album.SetLabel(album_name)
 
         return self.temp_album
 
-    def frame_to_timecode(self, frame: int, timeline: Any, use_timeline_start: bool = True, delimiter: str = "-") -> str:
+    def frame_to_timecode(self, frame: int, timeline: Any, delimiter: str = "-") -> str:
         """
-        Convert frame number to timecode string using cached timeline properties.
+        Convert a timeline-relative frame number to a record timecode string
+        using cached timeline properties.
 
         Args:
-            frame: Frame number
+            frame: Frame offset from the timeline start
             timeline: Timeline object
-            use_timeline_start: If True, use timeline's start timecode as base (for display)
-                               If False, convert absolute frame directly (for SetCurrentTimecode)
             delimiter: Delimiter to use between timecode components (default "-" for filenames, use ":" for API calls)
 
         Returns:
@@ -283,16 +437,16 @@ class MarkerStillExporter:
         try:
             # Get cached timeline properties (avoids repeated API calls)
             props = self._get_timeline_properties(timeline)
-            frame_rate = props['frame_rate']
 
-            if use_timeline_start:
-                # Clone the cached base Timecode object and add frame offset
-                # Note: We create a new instance to avoid mutating the cached object
-                tc = Timecode(frame_rate, start_timecode=props['start_tc'])
-                tc.add_frames(frame)
-            else:
-                # Direct frame to timecode conversion (for SetCurrentTimecode)
-                tc = Timecode(frame_rate, frames=frame)
+            start_frames = props['start_frames']
+            if start_frames is not None:
+                # Non-drop-frame: a divmod chain, no Timecode object per call
+                hours, minutes, seconds, frames = _frames_to_hmsf(start_frames + frame, props['fps_int'])
+                return f"{hours:02d}{delimiter}{minutes:02d}{delimiter}{seconds:02d}{delimiter}{frames:02d}"
+
+            # Drop-frame rates need the timecode module's frame counting
+            tc = _timecode_class()(props['frame_rate'], start_timecode=props['start_tc'])
+            tc.add_frames(frame)
 
             # Convert to string and apply delimiter
             tc_str = str(tc)
@@ -304,22 +458,6 @@ class MarkerStillExporter:
             print(f"WARNING: Failed to convert frame {frame} to timecode: {e}")
             return f"Frame{frame:06d}"
 
-    def generate_filename(self, timeline: Any, marker_frame: int) -> str:
-        """
-        Generate filename using timeline name and record timecode.
-
-        Args:
-            timeline: Timeline object
-            marker_frame: Frame number of marker
-
-        Returns:
-            Filename without extension in format: TimelineName_HH-MM-SS-FF
-        """
-        # Format: TimelineName_RecordTC
-        timeline_name = timeline.GetName().replace(" ", "_")
-        record_tc = self.frame_to_timecode(marker_frame, timeline)
-        return f"{timeline_name}_{record_tc}"
-
     def capture_stills(self, timeline_markers: list[tuple[Any, list[tuple[int, dict]]]]) -> list[tuple[Any, str]]:
         """
         Capture stills from markers to temporary Gallery album.
@@ -330,44 +468,95 @@ class MarkerStillExporter:
         Returns:
             List of (still_object, filename) tuples
         """
-        captured_stills = []
+        # Appended to in place, so cleanup sees every still without a second list
+        captured_stills = self._captured
 
         for timeline, markers in timeline_markers:
             # Set timeline as current
             self.project.SetCurrentTimeline(timeline)
 
-            # Get cached timeline properties (avoids repeated API call)
-            props = self._get_timeline_properties(timeline)
-            start_frame = props['start_frame']
-
-            for frame_id, marker_data in markers:
-                try:
-                    # Move playhead to marker position
-                    # Add timeline start frame offset to marker position
-                    absolute_frame = frame_id + start_frame
-                    # For setting playhead: use absolute frame without timeline start offset (needs colon delimiter for API)
-                    timeline.SetCurrentTimecode(self.frame_to_timecode(absolute_frame, timeline, use_timeline_start=False, delimiter=":"))
-
-                    # Generate filename (without extension)
-                    filename = self.generate_filename(timeline, frame_id)
-
-                    # Capture still to gallery
-                    still = timeline.GrabStill()
-
-                    if still:
-                        # Store still and filename for later labeling and export
-                        captured_stills.append((still, filename))
-                        # Track this still for cleanup
-                        self.created_stills.append(still)
-                    else:
-                        print(f"WARNING: Failed to capture still at frame {frame_id} in timeline '{timeline.GetName()}'")
-
-                except Exception as e:
-                    print(f"ERROR: Failed to capture still at frame {frame_id}: {e}")
-                    continue
+            # Fetched once per timeline instead of once per marker
+            timeline_name = timeline.GetName()
+
+            # All string work happens up front, the capture loop only talks to Resolve
+            plan = self._prepare_timeline_plan(timeline, timeline_name, markers)
+            self._execute_plan(timeline, timeline_name, plan, captured_stills)
 
         return captured_stills
 
+    def _prepare_timeline_plan(self, timeline: Any, timeline_name: str,
+                               markers: list[tuple[int, dict]]) -> list[tuple[int, str, str]]:
+        """
+        Compute playhead timecodes and filenames for one timeline's markers.
+
+        Args:
+            timeline: Timeline object
+            timeline_name: Name of the timeline
+            markers: List of (frame_id, marker_data) tuples
+
+        Returns:
+            List of (frame_id, record_timecode, filename) tuples
+        """
+        filename_prefix = timeline_name.replace(" ", "_")
+
+        try:
+            props = self._get_timeline_properties(timeline)
+        except Exception:
+            props = None  # frame_to_timecode() below reports the failure per marker
+
+        if props is not None and props['start_frames'] is not None:
+            # Non-drop-frame: convert the whole batch inline, both delimiter forms from one split
+            start_frames = props['start_frames']
+            fps_int = props['fps_int']
+            plan = []
+            for frame_id, _ in markers:
+                hours, minutes, seconds, frames = _frames_to_hmsf(start_frames + frame_id, fps_int)
+                plan.append((
+                    frame_id,
+                    f"{hours:02d}:{minutes:02d}:{seconds:02d}:{frames:02d}",
+                    f"{filename_prefix}_{hours:02d}-{minutes:02d}-{seconds:02d}-{frames:02d}",
+                ))
+            return plan
+
+        frame_to_timecode = self.frame_to_timecode
+
+        # Record timecode of each marker: one conversion serves both the
+        # playhead position (API needs ":") and the filename (uses "-")
+        record_tcs = [frame_to_timecode(frame_id, timeline, delimiter=":") for frame_id, _ in markers]
+        return [
+            (frame_id, record_tc, f"{filename_prefix}_{record_tc.replace(':', '-')}")
+            for (frame_id, _), record_tc in zip(markers, record_tcs)
+        ]
+
+    def _execute_plan(self, timeline: Any, timeline_name: str,
+                      plan: list[tuple[int, str, str]], captured_stills: list[tuple[Any, str]]) -> None:
+        """
+        Grab a still at every planned timecode of the (current) timeline.
+
+        Args:
+            timeline: Timeline object, already set as current
+            timeline_name: Name of the timeline (for warnings)
+            plan: List of (frame_id, record_timecode, filename) tuples
+            captured_stills: List that (still_object, filename) tuples are appended to
+        """
+        set_timecode = timeline.SetCurrentTimecode
+        grab_still = timeline.GrabStill
+
+        for frame_id, record_tc, filename in plan:
+            # Only the Resolve calls can raise; failures are otherwise reported by return values
+            try:
+                # Move playhead to marker position, then capture still to gallery
+                still = grab_still() if set_timecode(record_tc) else None
+            except Exception as e:
+                print(f"ERROR: Failed to capture still at frame {frame_id}: {e}")
+                continue
+
+            if still:
+                # Store still and filename for later labeling, export and cleanup
+                captured_stills.append((still, filename))
+            else:
+                print(f"WARNING: Failed to capture still at frame {frame_id} in timeline '{timeline_name}'")
+
     def export_stills(self, captured_stills: list[tuple[Any, str]],
                       export_folder: str, format_name: str) -> tuple[int, int]:
         """
@@ -394,13 +583,64 @@ class MarkerStillExporter:
         success_count = 0
         failure_count = 0
 
-        current_album = self.gallery.GetCurrentStillAlbum()
+        # Album selected by create_temp_album() (no extra lookup)
+        current_album = self.temp_album
+        if current_album is None:
+            print("ERROR: No Gallery album to export from")
+            return 0, len(captured_stills)
 
+        # Label every still first (label becomes the export filename base)
+        labeled_stills: list[tuple[Any, str]] = []
         for still, filename in captured_stills:
             try:
-                # Set still label (becomes export filename base)
                 current_album.SetLabel(still, filename)
+                labeled_stills.append((still, filename))
+            except Exception as e:
+                failure_count += 1
+                print(f"ERROR: Failed to label still '{filename}': {e}")
+
+        if not labeled_stills:
+            return success_count, failure_count
+
+        # Export all stills in one API call instead of one call per still
+        try:
+            batch_ok = current_album.ExportStills([still for still, _ in labeled_stills],
+                                                  export_folder, "", api_format)
+        except Exception as e:
+            print(f"WARNING: Batch export failed, exporting stills individually: {e}")
+            batch_ok = False
+
+        if batch_ok:
+            success_count += len(labeled_stills)
+            # Remove Resolve's auto-appended IDs on a background thread: pure file system
+            # work that overlaps with cleanup's Resolve calls (wait_for_renames() joins it)
+            filenames = [filename for _, filename in labeled_stills]
+            self._rename_thread = threading.Thread(
+                target=self._remove_resolve_ids_from_filenames,
+                args=(export_folder, filenames, extension),
+                daemon=True,
+            )
+            self._rename_thread.start()
+            return success_count, failure_count
 
+        # Batch call reports a single result and may have written some files before
+        # failing - one listing tells which stills are already on disk, only the
+        # others are retried (re-exporting the rest would duplicate their files)
+        try:
+            exported = self._find_exported_files(
+                export_folder, [filename for _, filename in labeled_stills], extension)
+        except OSError as e:
+            print(f"WARNING: Could not list export folder, retrying every still: {e}")
+            exported = {}
+
+        if exported:
+            success_count += len(exported)
+            self._rename_exported_files(export_folder, exported, extension)
+
+        for still, filename in labeled_stills:
+            if filename in exported:
+                continue
+            try:
                 # Export single still with format
                 result = current_album.ExportStills([still], export_folder, "", api_format)
 
@@ -418,6 +658,78 @@ class MarkerStillExporter:
 
         return success_count, failure_count
 
+    def _remove_resolve_ids_from_filenames(self, export_folder: str, base_filenames: list[str], extension: str) -> None:
+        """
+        Remove Resolve's auto-appended ID suffix from several exported files.
+
+        Args:
+            export_folder: Directory containing exported files
+            base_filenames: Filenames without extension
+            extension: File extension without dot
+        """
+        try:
+            renames = self._find_exported_files(export_folder, base_filenames, extension)
+        except OSError as e:
+            print(f"WARNING: Could not list export folder, renaming files one by one: {e}")
+            for base_filename in base_filenames:
+                self._remove_resolve_id_from_filename(export_folder, base_filename, extension)
+            return
+
+        self._rename_exported_files(export_folder, renames, extension)
+
+    def _find_exported_files(self, export_folder: str, base_filenames: list[str], extension: str) -> dict[str, str]:
+        """
+        Find exported files that still carry Resolve's auto-appended ID suffix.
+
+        Args:
+            export_folder: Directory containing exported files
+            base_filenames: Filenames without extension
+            extension: File extension without dot
+
+        Returns:
+            Dictionary mapping each base filename found to the path of its
+            "<base>_<ID>.<ext>" file
+
+        Raises:
+            OSError: If the export folder cannot be listed
+        """
+        # One directory listing instead of a glob (full listing) per file
+        suffix = f".{extension}"
+        wanted = set(base_filenames)
+        found: dict[str, str] = {}
+        with os.scandir(export_folder) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(suffix):
+                    continue
+                # "<base>_<Resolve ID>.<ext>" -> "<base>"
+                base, sep, _ = name[:-len(suffix)].rpartition("_")
+                if sep and base in wanted and base not in found:
+                    found[base] = entry.path
+        return found
+
+    def _rename_exported_files(self, export_folder: str, renames: dict[str, str], extension: str) -> None:
+        """
+        Rename exported files to their base filename.
+
+        Args:
+            export_folder: Directory containing exported files
+            renames: Dictionary mapping base filenames to current file paths
+            extension: File extension without dot
+        """
+        suffix = f".{extension}"
+        for base_filename, old_path in renames.items():
+            try:
+                os.rename(old_path, os.path.join(export_folder, f"{base_filename}{suffix}"))
+            except OSError as e:
+                print(f"WARNING: Failed to rename file: {e}")
+
+    def wait_for_renames(self) -> None:
+        """Wait until exported files started by export_stills() have their final names."""
+        if self._rename_thread is not None:
+            self._rename_thread.join()
+            self._rename_thread = None
+
     def _remove_resolve_id_from_filename(self, export_folder: str, base_filename: str, extension: str) -> bool:
         """
         Remove Resolve's auto-appended ID suffix from exported filename.
@@ -468,12 +780,23 @@ class MarkerStillExporter:
             return True
 
         try:
-            # Delete only the stills created by this script run
-            if self.created_stills:
-                self.temp_album.DeleteStills(self.created_stills)
-
-            # Clear the list of created stills
-            self.created_stills = []
+            # Delete only the stills created by this script run, in chunks
+            stills = self.created_stills
+            delete_stills = self.temp_album.DeleteStills
+            chunk_size = self.DELETE_CHUNK_SIZE
+            failed = 0
+            for start in range(0, len(stills), chunk_size):
+                chunk = stills[start:start + chunk_size]
+                # Retry a failed chunk once before giving up on it
+                if not self._delete_chunk(delete_stills, chunk) and not self._delete_chunk(delete_stills, chunk):
+                    failed += len(chunk)
+
+            # Start a fresh list; the one handed out by capture_stills stays intact
+            self._captured = []
+
+            if failed:
+                print(f"WARNING: Failed to delete {failed} still(s) from temporary album")
+                return False
 
             # Note: Gallery albums cannot be deleted via API
             # We can only delete the stills within the album
@@ -485,6 +808,23 @@ class MarkerStillExporter:
             print(f"WARNING: Failed to cleanup temporary album: {e}")
             return False
 
+    @staticmethod
+    def _delete_chunk(delete_stills: Any, chunk: list[Any]) -> bool:
+        """
+        Delete one chunk of stills from the temporary album.
+
+        Args:
+            delete_stills: Bound DeleteStills method of the album
+            chunk: Stills to delete
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            return bool(delete_stills(chunk))
+        except Exception:
+            return False
+
     def export_from_markers(self, export_folder: str, format_name: str, color_filter: str | None = None) -> tuple[int, int, str]:
         """
         Complete workflow: scan, capture, export, cleanup.
@@ -499,6 +839,14 @@ class MarkerStillExporter:
             error_message is empty string on success, contains error description on failure
         """
         try:
+            # Timeline settings may have changed since the last export in this session;
+            # within this run each timeline's properties are fetched only once
+            self._timeline_cache.clear()
+            # Timelines may also have been deleted and recreated under the same name
+            # without changing the count, so project timeline scans start over too
+            self._timeline_scans = {}
+            self._timeline_scans_count = -1
+
             # 1. Get selected timelines
             print("Getting selected timelines...")
             timelines = self.get_selected_timelines()
@@ -545,16 +893,19 @@ class MarkerStillExporter:
             print(f"Exporting stills to: {export_folder}")
             success_count, failure_count = self.export_stills(captured_stills, export_folder, format_name)
 
-            # 6. Cleanup
+            # 6. Cleanup (runs while exported files are being renamed)
             print("Cleaning up temporary album...")
             self.cleanup()
+            self.wait_for_renames()
 
             return success_count, failure_count, ""
 
         except Exception as e:
             print(f"ERROR: Export workflow failed: {e}")
+            import traceback
             traceback.print_exc()
             self.cleanup()
+            self.wait_for_renames()
             return 0, 0, f"Export workflow failed: {str(e)}"
 
 
@@ -702,6 +1053,7 @@ class StillExporterDialog:
 
         except Exception as e:
             print(f"ERROR: Failed to create dialog: {e}")
+            import traceback
             traceback.print_exc()
             return False
 
@@ -810,6 +1162,7 @@ def run_with_ui(resolve: Any) -> bool:
 
     except Exception as e:
         print(f"ERROR: UI mode failed: {e}")
+        import traceback
         traceback.print_exc()
         return False
 
@@ -904,6 +1257,7 @@ def run_console_mode(resolve: Any) -> bool:
 
     except Exception as e:
         print(f"ERROR: Console mode failed: {e}")
+        import traceback
         traceback.print_exc()
         return False
 
@@ -927,6 +1281,7 @@ def main() -> bool:
 
     except Exception as e:
         print(f"ERROR: {e}")
+        import traceback
         traceback.print_exc()
         return False
 
@@ -5,8 +5,34 @@ Checks that all requirements are met for running DaVinci Resolve Python scripts.
 """
 import sys
 import os
-import platform
-from pathlib import Path
+import stat
+import argparse
+import functools
+from collections import namedtuple
+
+# Status labels, colored only when writing to a terminal
+if sys.stdout.isatty():
+    _PASS = "\033[92m✓ PASS\033[0m"
+    _FAIL = "\033[91m✗ FAIL\033[0m"
+else:
+    _PASS = "✓ PASS"
+    _FAIL = "✗ FAIL"
+
+# Expected locations of the Resolve app, the scripting API and the Fusion script library
+_OSPaths = namedtuple("_OSPaths", ["resolve_path", "script_api_path", "script_lib_path"])
+
+_OS_PATHS = {
+    "Darwin": _OSPaths(
+        "/Applications/DaVinci Resolve/DaVinci Resolve.app",
+        "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting",
+        "/Applications/DaVinci Resolve/DaVinci Resolve.app/Contents/Libraries/Fusion/fusionscript.so",
+    ),
+    "Linux": _OSPaths(
+        "/opt/resolve",
+        "/opt/resolve/Developer/Scripting",
+        "/opt/resolve/libs/Fusion/fusionscript.so",
+    ),
+}
 
 
 def print_header(text):
@@ -18,10 +44,7 @@ def print_header(text):
 
 def print_status(check_name, passed, message=""):
     """Print a check result with status."""
-    status = "✓ PASS" if passed else "✗ FAIL"
-    color = "\033[92m" if passed else "\033[91m"
-    reset = "\033[0m"
-    print(f"{color}{status}{reset} {check_name}")
+    print(_PASS if passed else _FAIL, check_name)
     if message:
         print(f"      {message}")
 
@@ -29,49 +52,71 @@ def print_status(check_name, passed, message=""):
 def check_operating_system():
     """Check and display operating system information."""
     print_header("Operating System")
-    os_name = platform.system()
-    os_version = platform.version()
+    # sys/os only: the platform module drags in subprocess and re at startup.
+    # Same names as platform.system(); unknown systems use the Linux paths.
+    if sys.platform == "win32":
+        os_name = "Windows"
+        win_version = sys.getwindowsversion()
+        os_version = f"{win_version.major}.{win_version.minor}.{win_version.build}"
+    else:
+        uname = os.uname()
+        os_name = uname.sysname
+        os_version = uname.release
     print(f"OS: {os_name}")
     print(f"Version: {os_version}")
     print(f"Python: {sys.version}")
     return os_name
 
 
+@functools.cache
+def _get_os_paths(os_name):
+    """Get the expected Resolve paths for an OS (cached, so repeated runs reuse them)."""
+    if os_name == "Windows":
+        # Depends on PROGRAMFILES/PROGRAMDATA, so it cannot live in _OS_PATHS
+        resolve_path = os.path.join(os.environ.get('PROGRAMFILES', 'C:\\Program Files'),
+                                    "Blackmagic Design", "DaVinci Resolve")
+        script_api_path = os.path.join(os.environ.get('PROGRAMDATA', 'C:\\ProgramData'),
+                                       "Blackmagic Design", "DaVinci Resolve", "Support", "Developer", "Scripting")
+        return _OSPaths(resolve_path, script_api_path, os.path.join(resolve_path, "fusionscript.dll"))
+    return _OS_PATHS.get(os_name, _OS_PATHS["Linux"])
+
+
+def _probe(path):
+    """Stat a path once; returns the os.stat_result, or None if it does not exist."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
 def check_resolve_installation(os_name):
     """Check if DaVinci Resolve is installed."""
     print_header("DaVinci Resolve Installation")
 
-    if os_name == "Darwin":  # macOS
-        resolve_path = Path("/Applications/DaVinci Resolve/DaVinci Resolve.app")
-        script_api_path = Path("/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting")
-        script_lib_path = Path("/Applications/DaVinci Resolve/DaVinci Resolve.app/Contents/Libraries/Fusion/fusionscript.so")
-    elif os_name == "Windows":
-        resolve_path = Path(os.environ.get('PROGRAMFILES', 'C:/Program Files')) / "Blackmagic Design/DaVinci Resolve"
-        script_api_path = Path(os.environ.get('PROGRAMDATA', 'C:/ProgramData')) / "Blackmagic Design/DaVinci Resolve/Support/Developer/Scripting"
-        script_lib_path = Path(os.environ.get('PROGRAMFILES', 'C:/Program Files')) / "Blackmagic Design/DaVinci Resolve/fusionscript.dll"
-    else:  # Linux
-        resolve_path = Path("/opt/resolve")
-        script_api_path = Path("/opt/resolve/Developer/Scripting")
-        script_lib_path = Path("/opt/resolve/libs/Fusion/fusionscript.so")
+    resolve_path, script_api_path, script_lib_path = _get_os_paths(os_name)
 
+    # One stat per path covers both existence and the file/directory check
     # Check Resolve installation
-    resolve_installed = resolve_path.exists()
+    resolve_installed = _probe(resolve_path) is not None
     print_status("DaVinci Resolve Installation", resolve_installed,
-                 str(resolve_path) if resolve_installed else "Not found at expected location")
+                 resolve_path if resolve_installed else "Not found at expected location")
 
     # Check Script API path
-    api_exists = script_api_path.exists()
-    print_status("Scripting API Path", api_exists, str(script_api_path))
+    api_stat = _probe(script_api_path)
+    api_exists = api_stat is not None and stat.S_ISDIR(api_stat.st_mode)
+    print_status("Scripting API Path", api_exists, script_api_path)
 
     # Check Script Library
-    lib_exists = script_lib_path.exists()
-    print_status("Fusion Script Library", lib_exists, str(script_lib_path))
+    lib_stat = _probe(script_lib_path)
+    lib_exists = lib_stat is not None and stat.S_ISREG(lib_stat.st_mode)
+    print_status("Fusion Script Library", lib_exists, script_lib_path)
 
     # Check for Python module
     if api_exists:
-        module_path = script_api_path / "Modules" / "DaVinciResolveScript.py"
-        module_exists = module_path.exists()
-        print_status("DaVinciResolveScript Module", module_exists, str(module_path))
+        module_path = os.path.join(script_api_path, "Modules", "DaVinciResolveScript.py")
+        module_stat = _probe(module_path)
+        module_exists = module_stat is not None and stat.S_ISREG(module_stat.st_mode)
+        print_status("DaVinciResolveScript Module", module_exists, module_path)
     else:
         module_exists = False
         print_status("DaVinciResolveScript Module", False, "API path not found")
@@ -88,59 +133,56 @@ def check_environment_variables(os_name, paths):
     """Check if environment variables are set correctly."""
     print_header("Environment Variables")
 
-    if os_name == "Darwin":  # macOS
-        expected_api = "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting"
-        expected_lib = "/Applications/DaVinci Resolve/DaVinci Resolve.app/Contents/Libraries/Fusion/fusionscript.so"
-    elif os_name == "Windows":
-        expected_api = os.path.join(os.environ.get('PROGRAMDATA', 'C:\\ProgramData'),
-                                   "Blackmagic Design\\DaVinci Resolve\\Support\\Developer\\Scripting")
-        expected_lib = os.path.join(os.environ.get('PROGRAMFILES', 'C:\\Program Files'),
-                                   "Blackmagic Design\\DaVinci Resolve\\fusionscript.dll")
-    else:  # Linux
-        expected_api = "/opt/resolve/Developer/Scripting"
-        expected_lib = "/opt/resolve/libs/Fusion/fusionscript.so"
+    # Expected locations were already worked out by check_resolve_installation
+    expected_api = paths['script_api_path']
+    expected_lib = paths['script_lib_path']
+    env_get = os.environ.get
 
     # Check RESOLVE_SCRIPT_API
-    script_api = os.environ.get('RESOLVE_SCRIPT_API')
+    script_api = env_get('RESOLVE_SCRIPT_API')
     api_set = script_api is not None
     print_status("RESOLVE_SCRIPT_API", api_set,
                  script_api if api_set else "Not set")
 
     # Check RESOLVE_SCRIPT_LIB
-    script_lib = os.environ.get('RESOLVE_SCRIPT_LIB')
+    script_lib = env_get('RESOLVE_SCRIPT_LIB')
     lib_set = script_lib is not None
     print_status("RESOLVE_SCRIPT_LIB", lib_set,
                  script_lib if lib_set else "Not set")
 
     # Check PYTHONPATH
-    pythonpath = os.environ.get('PYTHONPATH', '')
+    # Compare whole entries (a substring match also accepts e.g. ".../Modules_old"),
+    # ignoring trailing separators like the one the suggested export adds
+    pythonpath_entries = {entry.rstrip("/\\") for entry in env_get('PYTHONPATH', '').split(os.pathsep)}
     modules_path = os.path.join(expected_api, "Modules")
-    pythonpath_set = modules_path in pythonpath
+    pythonpath_set = modules_path in pythonpath_entries
     print_status("PYTHONPATH includes Modules/", pythonpath_set,
                  "Contains Resolve modules path" if pythonpath_set else "Missing Resolve modules path")
 
     all_set = api_set and lib_set and pythonpath_set
 
     if not all_set:
-        print("\n" + "-" * 70)
-        print("To fix, add these to your shell profile:")
+        # Collected first and written with a single print
+        lines = ["\n" + "-" * 70, "To fix, add these to your shell profile:"]
         if os_name == "Darwin":
-            print("\n# For ~/.zshrc or ~/.bash_profile:")
+            lines.append("\n# For ~/.zshrc or ~/.bash_profile:")
         elif os_name == "Windows":
-            print("\n# For System Environment Variables:")
+            lines.append("\n# For System Environment Variables:")
         else:
-            print("\n# For ~/.bashrc:")
+            lines.append("\n# For ~/.bashrc:")
 
-        print(f'export RESOLVE_SCRIPT_API="{expected_api}"')
-        print(f'export RESOLVE_SCRIPT_LIB="{expected_lib}"')
-        print(f'export PYTHONPATH="$PYTHONPATH:$RESOLVE_SCRIPT_API/Modules/"')
+        lines.append(f'export RESOLVE_SCRIPT_API="{expected_api}"')
+        lines.append(f'export RESOLVE_SCRIPT_LIB="{expected_lib}"')
+        lines.append(f'export PYTHONPATH="$PYTHONPATH:$RESOLVE_SCRIPT_API/Modules/"')
 
         if os_name == "Darwin":
-            print("\nThen run: source ~/.zshrc  (or source ~/.bash_profile)")
+            lines.append("\nThen run: source ~/.zshrc  (or source ~/.bash_profile)")
         elif os_name == "Windows":
-            print("\nThen restart your terminal/IDE")
+            lines.append("\nThen restart your terminal/IDE")
         else:
-            print("\nThen run: source ~/.bashrc")
+            lines.append("\nThen run: source ~/.bashrc")
+
+        print("\n".join(lines))
 
     return all_set
 
@@ -174,77 +216,75 @@ def check_resolve_connection(dvr_script):
 
     try:
         resolve = dvr_script.scriptapp("Resolve")
-        if resolve:
-            print_status("Connect to Resolve", True, "Successfully connected to running instance")
-
-            # Get version info
-            try:
-                version = resolve.GetVersionString()
-                print(f"      DaVinci Resolve Version: {version}")
-            except:
-                pass
-
-            # Check for open project
-            try:
-                pm = resolve.GetProjectManager()
-                project = pm.GetCurrentProject()
-                if project:
-                    project_name = project.GetName()
-                    print_status("Current Project", True, f'"{project_name}"')
-
-                    # Check for timeline
-                    timeline = project.GetCurrentTimeline()
-                    if timeline:
-                        timeline_name = timeline.GetName()
-                        print_status("Current Timeline", True, f'"{timeline_name}"')
-                    else:
-                        print_status("Current Timeline", False, "No timeline is active")
-                else:
-                    print_status("Current Project", False, "No project is open")
-            except Exception as e:
-                print_status("Project/Timeline Check", False, str(e))
+    except Exception as e:
+        print_status("Connect to Resolve", False, str(e))
+        return False
 
+    if not resolve:
+        print_status("Connect to Resolve", False, "DaVinci Resolve is not running")
+        print("\n" + "-" * 70)
+        print("Please start DaVinci Resolve and try again.")
+        return False
+
+    print_status("Connect to Resolve", True, "Successfully connected to running instance")
+
+    # Version, project and timeline in one chain: each call goes over the scripting
+    # bridge, and nothing past the first missing piece is queried
+    try:
+        print(f"      DaVinci Resolve Version: {resolve.GetVersionString()}")
+
+        project = resolve.GetProjectManager().GetCurrentProject()
+        if not project:
+            print_status("Current Project", False, "No project is open")
             return True
+        print_status("Current Project", True, f'"{project.GetName()}"')
+
+        # Check for timeline
+        timeline = project.GetCurrentTimeline()
+        if timeline:
+            print_status("Current Timeline", True, f'"{timeline.GetName()}"')
         else:
-            print_status("Connect to Resolve", False, "DaVinci Resolve is not running")
-            print("\n" + "-" * 70)
-            print("Please start DaVinci Resolve and try again.")
-            return False
+            print_status("Current Timeline", False, "No timeline is active")
     except Exception as e:
-        print_status("Connect to Resolve", False, str(e))
-        return False
+        print_status("Project/Timeline Check", False, str(e))
+
+    return True
 
 
 def check_python_path():
     """Display Python's module search paths."""
     print_header("Python Module Search Paths")
     print("Python will search these paths for modules:")
-    for i, path in enumerate(sys.path, 1):
-        print(f"  {i}. {path}")
+    # One write for the whole list
+    print("\n".join(f"  {i}. {path}" for i, path in enumerate(sys.path, 1)))
 
 
 def print_summary(checks):
     """Print overall summary."""
     print_header("Summary")
 
-    all_passed = all(checks.values())
+    # One pass: the failed checks also tell whether everything passed
+    failed = [check for check, passed in checks.items() if not passed]
 
-    if all_passed:
+    if not failed:
         print("\n✓ All checks passed! Your system is ready to run DaVinci Resolve scripts.")
         print("\nYou can now run scripts like:")
         print("  python3 show_timeline_name.py")
     else:
         print("\n✗ Some checks failed. Please fix the issues above.")
         print("\nFailed checks:")
-        for check, passed in checks.items():
-            if not passed:
-                print(f"  - {check}")
+        print("\n".join(f"  - {check}" for check in failed))
 
     print()
 
 
-def main():
+def main(argv=None):
     """Run all verification checks."""
+    parser = argparse.ArgumentParser(description="Verify the DaVinci Resolve Python scripting setup.")
+    parser.add_argument("--verbose", action="store_true",
+                        help="also list Python's module search paths")
+    args = parser.parse_args(argv)
+
     print("\n" + "=" * 70)
     print("  DaVinci Resolve Python Scripting - Setup Verification")
     print("=" * 70)
@@ -262,8 +302,9 @@ def main():
     env_vars_set = check_environment_variables(os_name, paths)
     checks['Environment Variables'] = env_vars_set
 
-    # 4. Show Python paths
-    check_python_path()
+    # 4. Show Python paths (long and rarely needed, so only on request)
+    if args.verbose:
+        check_python_path()
 
     # 5. Try importing the module
     can_import, dvr_script = check_python_import()